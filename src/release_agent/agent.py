@@ -19,11 +19,6 @@ This is the main entry point for the agent, whether called from the API
 
 from __future__ import annotations
 
-import argparse
-import asyncio
-import json
-import sys
-
 from release_agent.llm import LLMClient, LLMConfig
 from release_agent.logging_config import get_logger
 from release_agent.policy import apply_policies
@@ -47,11 +42,14 @@ class ReleaseRiskAgent:
     def __init__(
         self,
         llm_config: LLMConfig | None = None,
+        llm: LLMClient | None = None,
     ) -> None:
         """Initialize the agent with its dependencies.
 
         Args:
             llm_config: Configuration for the LLM client. Uses defaults if None.
+            llm: An existing LLM client to share (e.g. one per process in the
+                API). If None, a new client is created from llm_config.
         """
         # TODO: Initialize the agent's dependencies.
         #
@@ -62,7 +60,7 @@ class ReleaseRiskAgent:
         # 2. Store any other dependencies you might need.
         #    For now, just the LLM client. In Phase 4, you'll add
         #    the policy engine here too.
-        self.llm = LLMClient(config=llm_config)
+        self.llm = llm or LLMClient(config=llm_config)
 
     async def assess(self, release: ReleaseInput) -> ReleaseOutput:
         """Run a full risk assessment on a release.
@@ -121,50 +119,9 @@ class ReleaseRiskAgent:
 # CLI Entry Point
 # ---------------------------------------------------------------------------
 
-
-def main() -> None:
-    """CLI entry point for running the agent from the command line.
-
-    Usage:
-        release-agent --input release_data.json
-        cat release_data.json | release-agent
-
-    This lets you test the agent locally without running the API server.
-    """
-    # TODO: Implement the CLI entry point.
-    #
-    # Steps:
-    # 1. Set up argument parsing:
-    parser = argparse.ArgumentParser(description="Release Risk Assessment Agent")
-    parser.add_argument(
-        "--input", "-i",
-        type=str,
-        help="Path to JSON file with release data (reads stdin if omitted)",
-    )
-    args = parser.parse_args()
-    # 2. Read input data:
-    if not args.input and sys.stdin.isatty():
-      parser.print_usage()
-      print("Provide --input FILE or pipe JSON via stdin.")
-      return
-
-    if args.input:
-        with open(args.input) as f:
-            data = json.load(f)
-    else:
-        data = json.load(sys.stdin)
-
-    # 3. Parse into ReleaseInput:
-    release = ReleaseInput.model_validate(data)
-    #
-    # 4. Create agent and run assessment:
-    agent = ReleaseRiskAgent()
-    result = asyncio.run(agent.assess(release))
-    #
-    # 5. Print the result as formatted JSON:
-    print(result.model_dump_json(indent=2))
-
-
+# The CLI lives in cli.py so its usage path stays import-light; re-exported
+# here for existing imports and `python -m release_agent.agent`.
+from release_agent.cli import main  # noqa: E402
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,61 @@
+"""Command-line entry point for the release risk agent.
+
+Kept separate from agent.py so that argument parsing and the usage path
+only import the standard library. The agent, and with it the OpenAI SDK and
+Pydantic, is imported once we know there is a release to assess.
+
+Usage:
+    release-agent --input release_data.json
+    cat release_data.json | release-agent
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+
+def main() -> None:
+    """CLI entry point for running the agent from the command line.
+
+    Usage:
+        release-agent --input release_data.json
+        cat release_data.json | release-agent
+
+    This lets you test the agent locally without running the API server.
+    """
+    # 1. Set up argument parsing:
+    parser = argparse.ArgumentParser(description="Release Risk Assessment Agent")
+    parser.add_argument(
+        "--input", "-i",
+        type=str,
+        help="Path to JSON file with release data (reads stdin if omitted)",
+    )
+    args = parser.parse_args()
+
+    # 2. Read input data:
+    if not args.input and sys.stdin.isatty():
+        parser.print_usage()
+        print("Provide --input FILE or pipe JSON via stdin.")
+        return
+
+    raw = Path(args.input).read_bytes() if args.input else sys.stdin.buffer.read()
+
+    # 3. Parse into ReleaseInput (heavy imports only from here on):
+    from release_agent.agent import ReleaseRiskAgent
+    from release_agent.schemas import ReleaseInput
+
+    release = ReleaseInput.model_validate_json(raw)
+
+    # 4. Create agent and run assessment:
+    agent = ReleaseRiskAgent()
+    result = asyncio.run(agent.assess(release))
+
+    # 5. Print the result as formatted JSON:
+    print(result.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,11 +18,12 @@ Design notes:
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Protocol
 
+import orjson
+
 # ---------------------------------------------------------------------------
 # Protocol
 # ---------------------------------------------------------------------------
@@ -103,8 +104,7 @@ class JSONIncidentLoader:
             return []
 
         # 2. Load the JSON file:
-        with open(self._file_path) as f:
-            incidents = json.load(f)
+        incidents = orjson.loads(self._file_path.read_bytes())
 
         # 3. Filter by repo (if the incident has a repo field):
         relevant = [
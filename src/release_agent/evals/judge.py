@@ -21,7 +21,7 @@ risk assessments on multiple dimensions.
 
 from __future__ import annotations
 
-import json
+import orjson
 
 from release_agent.evals.runner import EvalResult
 from release_agent.llm import LLMClient, LLMConfig
@@ -155,8 +155,8 @@ async def run_judge_eval(
     # 4. Parse the judge's JSON response:
     content = response.choices[0].message.content
     try:
-        scores = json.loads(content)
-    except json.JSONDecodeError as exc:
+        scores = orjson.loads(content or "")
+    except orjson.JSONDecodeError as exc:
         return [
             EvalResult(
                 eval_type="judge",
@@ -28,8 +28,14 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from release_agent.agent import ReleaseRiskAgent
-from release_agent.schemas import Decision, ReleaseInput, ReleaseOutput
+from release_agent.schemas import (
+    RELEASE_INPUT_LIST_ADAPTER,
+    RELEASE_OUTPUT_LIST_ADAPTER,
+    Decision,
+)
 
 # ---------------------------------------------------------------------------
 # Result Types
@@ -110,8 +116,7 @@ def load_gold_examples(path: str | Path) -> list[dict[str, Any]]:
     Returns:
         List of gold example dicts
     """
-    with open(path) as f:
-        examples = json.load(f)
+    examples = orjson.loads(Path(path).read_bytes())
 
     for i, ex in enumerate(examples):
         if "input" not in ex:
@@ -180,10 +185,17 @@ class EvalRunner:
         total_decisions = 0
         examples_passed = 0
 
-        for example in examples:
+        # Validate every example up front, so a malformed one fails before
+        # any LLM calls are spent:
+        inputs = RELEASE_INPUT_LIST_ADAPTER.validate_python([ex["input"] for ex in examples])
+        expected_outputs = RELEASE_OUTPUT_LIST_ADAPTER.validate_python(
+            [ex["expected_output"] for ex in examples]
+        )
+
+        for example, input_data, expected in zip(
+            examples, inputs, expected_outputs, strict=True
+        ):
             example_id = example["id"]
-            input_data = ReleaseInput.model_validate(example["input"])
-            expected = ReleaseOutput.model_validate(example["expected_output"])
 
             example_passed = False
 
@@ -224,7 +236,7 @@ class EvalRunner:
                 # Semantic evals
                 try:
                     sem_results = await run_semantic_evals(
-                        actual, expected, example_id
+                        actual, expected, example_id, llm_client=self.agent.llm
                     )
                     run_results.extend(sem_results)
                 except Exception as e:
@@ -20,6 +20,8 @@ Uses OpenAI's text-embedding-3-small model for embeddings.
 
 from __future__ import annotations
 
+import asyncio
+
 import numpy as np
 
 from release_agent.evals.runner import EvalResult
@@ -82,7 +84,9 @@ async def run_semantic_evals(
         actual: The agent's actual output
         expected: The expected (gold) output
         example_id: Identifier for the gold example
-        llm_client: LLM client for generating embeddings
+        llm_client: LLM client for generating embeddings. Pass a shared
+            client where possible; without one, a temporary client is
+            created and closed before returning.
         similarity_threshold: Minimum similarity score for explanation similarity
         summary_threshold: Minimum similarity score for summary (lower because
             summaries are shorter and carry less embedding signal)
@@ -91,18 +95,19 @@ async def run_semantic_evals(
         List of EvalResult objects
     """
     client = llm_client or LLMClient()
-    results = []
-    results.append(
-        await check_explanation_similarity(
-            actual, expected, example_id, client, similarity_threshold
-        )
-    )
-    results.append(
-        await check_summary_similarity(
-            actual, expected, example_id, client, summary_threshold
+    try:
+        results = await asyncio.gather(
+            check_explanation_similarity(
+                actual, expected, example_id, client, similarity_threshold
+            ),
+            check_summary_similarity(
+                actual, expected, example_id, client, summary_threshold
+            ),
         )
-    )
-    return results
+    finally:
+        if llm_client is None:
+            await client.aclose()
+    return list(results)
 
 
 async def check_explanation_similarity(
@@ -125,9 +130,12 @@ async def check_explanation_similarity(
         EvalResult with similarity score
     """
 
-    # 1. Get embeddings for both explanations:
-    actual_emb = await client.get_embedding(actual.explanation)
-    expected_emb = await client.get_embedding(expected.explanation)
+    # 1. Get embeddings for both explanations (concurrently, so the client
+    #    can coalesce them into one batched request):
+    actual_emb, expected_emb = await asyncio.gather(
+        client.get_embedding(actual.explanation),
+        client.get_embedding(expected.explanation),
+    )
 
     # 2. Compute cosine similarity:
     similarity = cosine_similarity(actual_emb, expected_emb)
@@ -165,8 +173,10 @@ async def check_summary_similarity(
     Returns:
         EvalResult with similarity score
     """
-    actual_emb = await client.get_embedding(actual.summary)
-    expected_emb = await client.get_embedding(expected.summary)
+    actual_emb, expected_emb = await asyncio.gather(
+        client.get_embedding(actual.summary),
+        client.get_embedding(expected.summary),
+    )
 
     similarity = cosine_similarity(actual_emb, expected_emb)
 
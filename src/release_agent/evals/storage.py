@@ -8,7 +8,8 @@ be tracked over time. This enables:
 - Comparing different agent configurations
 
 BigQuery schema:
-    eval_results (table)
+    eval_results (table, partitioned by DATE(timestamp),
+                  clustered by eval_type, model_version)
     ├── run_id: STRING (UUID for each eval run)
     ├── timestamp: TIMESTAMP
     ├── model_version: STRING (e.g., "gpt-4o-2024-01-25")
@@ -28,7 +29,7 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 import uuid
 from datetime import UTC, datetime
@@ -36,9 +37,50 @@ from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 
 from release_agent.evals.runner import EvalReport
 
+# 1 MB write buffer so streamed result rows are coalesced into few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# DDL for the results table. Partitioning on the row timestamp lets the
+# trend query prune to the last N days instead of scanning full history,
+# and clustering co-locates rows for the common eval_type/model filters.
+_EVAL_RESULTS_DDL = """
+CREATE TABLE IF NOT EXISTS `{table_ref}` (
+    run_id STRING,
+    timestamp TIMESTAMP,
+    model_version STRING,
+    eval_type STRING,
+    eval_name STRING,
+    example_id STRING,
+    passed BOOL,
+    score FLOAT64,
+    details STRING,
+    metadata JSON
+)
+PARTITION BY DATE(timestamp)
+CLUSTER BY eval_type, model_version
+"""
+
+# Daily roll-up of the results table. BigQuery refreshes it incrementally,
+# so the trend query scans one row per (day, eval_type, model) instead of
+# every individual check in the window.
+_PASS_RATE_DAILY_DDL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS `{view_ref}`
+PARTITION BY date
+CLUSTER BY eval_type, model_version
+AS SELECT
+    DATE(timestamp) AS date,
+    eval_type,
+    model_version,
+    COUNTIF(passed) AS passed,
+    COUNT(*) AS total
+FROM `{table_ref}`
+GROUP BY date, eval_type, model_version
+"""
+
 
 # ---------------------------------------------------------------------------
 # Slack Alerting
@@ -92,6 +134,40 @@ async def _alert_if_needed(report: EvalReport, run_id: str) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _write_report_file(filepath: Path, header: dict[str, Any], report: EvalReport) -> None:
+    """Stream an eval report to disk as a single JSON document.
+
+    The results array is written row by row instead of building the whole
+    document in memory first; peak memory stays at one result.
+
+    Args:
+        filepath: Destination file
+        header: Top-level run fields written before the results array
+        report: The eval report whose results and metadata are written
+    """
+    with open(filepath, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(orjson.dumps(header)[:-1])
+        f.write(b',"results":[')
+        for i, r in enumerate(report.results):
+            if i:
+                f.write(b",")
+            f.write(
+                orjson.dumps(
+                    {
+                        "eval_type": r.eval_type,
+                        "eval_name": r.eval_name,
+                        "passed": r.passed,
+                        "score": r.score,
+                        "details": r.details,
+                        "example_id": r.example_id,
+                    }
+                )
+            )
+        f.write(b'],"metadata":')
+        f.write(orjson.dumps(report.metadata))
+        f.write(b"}")
+
+
 class LocalEvalStorage:
     """Stores eval results as JSON files locally.
 
@@ -107,6 +183,7 @@ class LocalEvalStorage:
             output_dir: Directory to store result files
         """
         self._output_dir = Path(output_dir)
+        self._dir_ready = False
 
     async def store_report(self, report: EvalReport) -> str:
         """Store an eval report as a JSON file.
@@ -117,35 +194,25 @@ class LocalEvalStorage:
         Returns:
             Path to the saved file
         """
-        self._output_dir.mkdir(parents=True, exist_ok=True)
+        if not self._dir_ready:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
 
         run_id = uuid.uuid4().hex[:8]
         timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
         filename = f"eval_{timestamp}_{run_id}.json"
 
-        data = {
+        header = {
             "run_id": run_id,
             "timestamp": report.timestamp,
             "total_examples": report.total_examples,
             "pass_rate": report.pass_rate,
             "false_go_rate": report.false_go_rate,
-            "results": [
-                {
-                    "eval_type": r.eval_type,
-                    "eval_name": r.eval_name,
-                    "passed": r.passed,
-                    "score": r.score,
-                    "details": r.details,
-                    "example_id": r.example_id,
-                }
-                for r in report.results
-            ],
-            "metadata": report.metadata,
         }
 
+        # File I/O is blocking — run it in a worker thread, not on the loop.
         filepath = self._output_dir / filename
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        await asyncio.to_thread(_write_report_file, filepath, header, report)
 
         await _alert_if_needed(report, run_id)
         return str(filepath)
@@ -172,6 +239,7 @@ class BigQueryEvalStorage:
         project_id: str | None = None,
         dataset: str = "release_agent_evals",
         table: str = "eval_results",
+        view: str = "eval_pass_rate_daily",
     ) -> None:
         """Initialize BigQuery storage.
 
@@ -179,14 +247,31 @@ class BigQueryEvalStorage:
             project_id: GCP project ID. Reads from GCP_PROJECT_ID env var if None.
             dataset: BigQuery dataset name
             table: BigQuery table name
+            view: Name of the daily pass-rate materialized view
         """
         from google.cloud import bigquery
 
         project_id = project_id or os.environ.get("GCP_PROJECT_ID")
         if not project_id:
             raise ValueError("project_id required: pass it or set GCP_PROJECT_ID env var")
+        self._bigquery = bigquery
         self._client = bigquery.Client(project=project_id)
         self._table_ref = f"{project_id}.{dataset}.{table}"
+        self._view_ref = f"{project_id}.{dataset}.{view}"
+        self._table_ready = False
+
+    def _ensure_table(self) -> None:
+        """Create the results table and its daily roll-up view if missing.
+
+        Runs the DDL at most once per storage instance.
+        """
+        if self._table_ready:
+            return
+        self._client.query(_EVAL_RESULTS_DDL.format(table_ref=self._table_ref)).result()
+        self._client.query(
+            _PASS_RATE_DAILY_DDL.format(view_ref=self._view_ref, table_ref=self._table_ref)
+        ).result()
+        self._table_ready = True
 
     async def store_report(self, report: EvalReport) -> str:
         """Store eval results as rows in BigQuery.
@@ -201,6 +286,8 @@ class BigQueryEvalStorage:
             The run_id for this eval run
         """
         run_id = uuid.uuid4().hex
+        # Same metadata on every row — serialize it once, not per result.
+        metadata_json = orjson.dumps(report.metadata).decode()
 
         rows = [
             {
@@ -213,12 +300,15 @@ class BigQueryEvalStorage:
                 "passed": r.passed,
                 "score": r.score,
                 "details": r.details,
-                "metadata": json.dumps(report.metadata),
+                "metadata": metadata_json,
             }
             for r in report.results
         ]
 
-        errors = self._client.insert_rows_json(self._table_ref, rows)
+        # The BigQuery client is synchronous; keep it off the event loop.
+        if not self._table_ready:
+            await asyncio.to_thread(self._ensure_table)
+        errors = await asyncio.to_thread(self._client.insert_rows_json, self._table_ref, rows)
         if errors:
             raise RuntimeError(f"BigQuery insert errors: {errors}")
 
@@ -239,19 +329,32 @@ class BigQueryEvalStorage:
         Returns:
             List of dicts with date, pass_rate, total_checks
         """
+        # Reads the daily roll-up rather than raw rows. Fully parameterized
+        # so the query text is constant across calls (cacheable, and no
+        # string interpolation of eval_type).
         query = f"""
 SELECT
-    DATE(timestamp) AS date,
-    COUNTIF(passed) / COUNT(*) AS pass_rate,
-    COUNT(*) AS total_checks
-FROM `{self._table_ref}`
-WHERE timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {days} DAY)
+    date,
+    SUM(passed) / SUM(total) AS pass_rate,
+    SUM(total) AS total_checks
+FROM `{self._view_ref}`
+WHERE date > DATE_SUB(CURRENT_DATE(), INTERVAL @days DAY)
+  AND (@eval_type IS NULL OR eval_type = @eval_type)
+GROUP BY date
+ORDER BY date
 """
-        if eval_type:
-            query += f"  AND eval_type = '{eval_type}'\n"
-        query += "GROUP BY date\nORDER BY date"
+        job_config = self._bigquery.QueryJobConfig(
+            query_parameters=[
+                self._bigquery.ScalarQueryParameter("days", "INT64", days),
+                self._bigquery.ScalarQueryParameter("eval_type", "STRING", eval_type or None),
+            ]
+        )
 
-        result = self._client.query(query).result()
+        # The BigQuery client is synchronous; keep it off the event loop.
+        if not self._table_ready:
+            await asyncio.to_thread(self._ensure_table)
+        job = await asyncio.to_thread(self._client.query, query, job_config=job_config)
+        result = await asyncio.to_thread(job.result)
         return [
             {
                 "date": str(row.date),
@@ -15,15 +15,109 @@ Design notes:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import importlib.util
+import logging
 import os
 from typing import Any
 
+import httpx
+import openai
 from openai import AsyncOpenAI
-from pydantic import BaseModel
-from tenacity import retry, stop_after_attempt, wait_exponential
-
-from release_agent.schemas import ReleaseOutput
+from openai.types.chat import ChatCompletionMessageParam
+from openai.types.shared_params import ResponseFormatJSONSchema
+from pydantic import BaseModel, ValidationError
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+
+from release_agent.logging_config import get_logger
+from release_agent.schemas import (
+    ReleaseOutput,
+    get_release_output_schema,
+    get_release_output_schema_bytes,
+)
+
+logger = get_logger(__name__)
+
+# Decoded once so _get_schema_json() can hand out the same str every call
+_RELEASE_OUTPUT_SCHEMA_JSON: str = get_release_output_schema_bytes().decode()
+
+# Embedding request coalescing: concurrent get_embedding() calls are batched
+# into a single embeddings.create() call of up to this many inputs, waiting
+# at most this long for a batch to fill.
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_EMBEDDING_MAX_BATCH = 128
+_EMBEDDING_MAX_WAIT_SECONDS = 0.02
+
+
+
+def _to_strict_json_schema(node: Any, defs: dict[str, Any] | None = None) -> Any:
+    """Return a copy of a Pydantic JSON schema that OpenAI's strict mode accepts.
+
+    Strict Structured Outputs require every object to forbid additional
+    properties and to list all of its properties as required, and reject
+    ``$ref`` alongside sibling keywords (Pydantic emits those for enum fields
+    with a description), so such refs are inlined.
+
+    Args:
+        node: A schema, or a node within one
+        defs: The root schema's ``$defs``; taken from ``node`` at the root
+
+    Returns:
+        The strict copy of ``node``
+    """
+    if isinstance(node, list):
+        return [_to_strict_json_schema(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    if defs is None:
+        defs = node.get("$defs", {})
+    ref = node.get("$ref")
+    if isinstance(ref, str) and len(node) > 1 and ref.startswith("#/$defs/"):
+        siblings = {k: v for k, v in node.items() if k != "$ref"}
+        node = {**defs[ref.removeprefix("#/$defs/")], **siblings}
+
+    strict = {k: _to_strict_json_schema(v, defs) for k, v in node.items()}
+    if strict.get("type") == "object" and "properties" in strict:
+        strict["additionalProperties"] = False
+        strict["required"] = list(strict["properties"])
+    if "default" in strict and strict["default"] is None:
+        del strict["default"]
+    return strict
+
+
+# Strict json_schema response_format for ReleaseOutput, built once at import
+# so each request sends the same schema without re-walking the Pydantic model.
+_RESPONSE_FORMAT: ResponseFormatJSONSchema = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ReleaseOutput",
+        "schema": _to_strict_json_schema(get_release_output_schema()),
+        "strict": True,
+    },
+}
+
+# Connection pool for the OpenAI HTTP client. HTTP/2 lets concurrent
+# assess_risk() calls multiplex over one connection; it needs the optional
+# h2 package (httpx[http2]), so fall back to HTTP/1.1 when it's missing.
+_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+_HTTP_TIMEOUT_SECONDS = 60.0
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Only transient API failures are worth retrying. Schema validation errors
+# (ValueError) would just fail again, so they surface immediately.
+_RETRYABLE_ERRORS = (
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
 
 
 class LLMConfig(BaseModel):
@@ -49,9 +143,10 @@ class LLMClient:
         client = LLMClient(config=LLMConfig())
         result = await client.assess_risk(system_prompt, user_prompt)
 
-    The client uses OpenAI's JSON mode to ensure the response conforms to
-    the ReleaseOutput schema. If the response fails validation, it raises
-    a ValueError with details about what went wrong.
+    The client uses OpenAI's Structured Outputs with a strict JSON schema
+    derived from ReleaseOutput (built once at import), and validates the
+    reply with pydantic-core. If the response fails validation, it raises a
+    ValueError with details about what went wrong.
     """
 
     def __init__(self, config: LLMConfig | None = None) -> None:
@@ -69,11 +164,26 @@ class LLMClient:
         # Hint: AsyncOpenAI(api_key=...) — if api_key is None, the SDK
         #   automatically reads from the OPENAI_API_KEY env var.
         api_key = self.config.api_key or os.environ.get("OPENAI_API_KEY")
-        self._client = AsyncOpenAI(api_key=api_key)
+        http_client = httpx.AsyncClient(
+            limits=_HTTP_LIMITS,
+            http2=_HTTP2_AVAILABLE,
+            timeout=_HTTP_TIMEOUT_SECONDS,
+        )
+        self._client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+        # Embedding batcher state, created lazily on the running event loop
+        self._embedding_queue: asyncio.Queue[tuple[str, asyncio.Future[list[float]]]] | None = None
+        self._embedding_loop: asyncio.AbstractEventLoop | None = None
+        self._embedding_worker: asyncio.Task[None] | None = None
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
+        # 0.25 s, 0.5 s, ... capped at 10 s, plus up to 0.5 s of jitter so
+        # concurrent requests don't retry in lockstep.
+        wait=wait_exponential(multiplier=0.25, max=10) + wait_random(0, 0.5),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
     )
     async def assess_risk(
         self,
@@ -84,9 +194,8 @@ class LLMClient:
 
         This method:
         1. Sends the system + user prompts to OpenAI
-        2. Requests JSON output conforming to the ReleaseOutput schema
-        3. Parses and validates the response
-        4. Returns a typed ReleaseOutput object
+        2. Requests Structured Output using the precomputed ReleaseOutput schema
+        3. Validates the JSON reply straight into a ReleaseOutput
 
         Args:
             system_prompt: The system message (instructions, persona, rules)
@@ -98,39 +207,11 @@ class LLMClient:
         Raises:
             ValueError: If the LLM response doesn't conform to the schema
             openai.APIError: If the OpenAI API call fails after retries
+                (only connection, rate-limit and 5xx errors are retried)
         """
-        # TODO: Implement the OpenAI API call with structured output.
-        #
-        # Steps:
-        # 1. Build the messages list:
-        #    messages = [
-        #        {"role": "system", "content": system_prompt},
-        #        {"role": "user", "content": user_prompt},
-        #    ]
-        #
-        # 2. Call self._client.chat.completions.create() with:
-        #    - model=self.config.model
-        #    - messages=messages
-        #    - temperature=self.config.temperature
-        #    - max_tokens=self.config.max_tokens
-        #    - response_format={"type": "json_object"}
-        #
-        # 3. Extract the response content:
-        #    content = response.choices[0].message.content
-        #
-        # 4. Parse the JSON string into a dict:
-        #    data = json.loads(content)
-        #
-        # 5. Validate using Pydantic:
-        #    return ReleaseOutput.model_validate(data)
-        #
-        # 6. If json.loads() or model_validate() fails, raise ValueError
-        #    with a helpful message including the raw content.
-        #
-        # Hint: Wrap the parse/validate in try/except to give clear errors.
-        messages = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": user_prompt},
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
         ]
 
         response = await self._client.chat.completions.create(
@@ -138,30 +219,29 @@ class LLMClient:
             messages=messages,
             temperature=self.config.temperature,
             max_tokens=self.config.max_tokens,
-            response_format={"type": "json_object"},
+            response_format=_RESPONSE_FORMAT,
         )
 
-        content = response.choices[0].message.content
-
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"LLM returned invalid JSON: {e}\nRaw content: {content[:500]}"
-            ) from e
+        message = response.choices[0].message
+        if message.refusal:
+            raise ValueError(f"LLM refused to produce an assessment: {message.refusal}")
 
+        # Parse and validate the JSON reply in a single pydantic-core pass
+        content = message.content or ""
         try:
-            return ReleaseOutput.model_validate(data)
-        except Exception as e:
+            return ReleaseOutput.model_validate_json(content)
+        except ValidationError as e:
             raise ValueError(
-                f"LLM output failed schema validation: {e}\n"
-                f"Raw data: {json.dumps(data, indent=2)[:500]}"
+                f"LLM output failed schema validation: {e}\nRaw content: {content[:500]}"
             ) from e
 
     async def get_embedding(self, text: str) -> list[float]:
         """Get an embedding vector for the given text.
 
-        Used in Phase 5 for semantic similarity evals.
+        Used in Phase 5 for semantic similarity evals. Concurrent callers
+        are coalesced by a background flusher into one batched embeddings
+        request (up to 128 inputs or 20 ms), so N texts cost ~N/128 round
+        trips instead of N.
 
         Args:
             text: The text to embed
@@ -169,20 +249,86 @@ class LLMClient:
         Returns:
             A list of floats representing the embedding vector
         """
-        response = await self._client.embeddings.create(
-            model="text-embedding-3-small",
-            input=text,
-        )
-        return response.data[0].embedding
+        loop = asyncio.get_running_loop()
+        if self._embedding_queue is None or self._embedding_loop is not loop:
+            self._embedding_queue = asyncio.Queue()
+            self._embedding_loop = loop
+            self._embedding_worker = loop.create_task(
+                self._flush_embeddings(self._embedding_queue)
+            )
+
+        future: asyncio.Future[list[float]] = loop.create_future()
+        await self._embedding_queue.put((text, future))
+        return await future
+
+    async def _flush_embeddings(
+        self,
+        queue: asyncio.Queue[tuple[str, asyncio.Future[list[float]]]],
+    ) -> None:
+        """Drain queued embedding requests in batches until cancelled.
+
+        Args:
+            queue: The queue of (text, future) pairs fed by get_embedding()
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _EMBEDDING_MAX_WAIT_SECONDS
+            while len(batch) < _EMBEDDING_MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            try:
+                response = await self._client.embeddings.create(
+                    model=_EMBEDDING_MODEL,
+                    input=[text for text, _ in batch],
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for item in response.data:
+                future = batch[item.index][1]
+                if not future.done():
+                    future.set_result(item.embedding)
+
+    async def aclose(self) -> None:
+        """Release the HTTP connection pool and stop the embedding batcher.
+
+        Call once on shutdown for long-lived clients (e.g. the API's
+        process-wide client).
+        """
+        if self._embedding_worker is not None:
+            self._embedding_worker.cancel()
+            self._embedding_worker = None
+            self._embedding_queue = None
+            self._embedding_loop = None
+        await self._client.close()
 
     def _get_schema_for_response_format(self) -> dict[str, Any]:
-        """Generate the JSON schema to send to OpenAI for structured output.
+        """Return the JSON schema to send to OpenAI for structured output.
+
+        The schema is computed once when schemas is imported; treat the
+        returned dict as read-only.
 
         Returns:
             The JSON schema dict derived from ReleaseOutput
         """
-        # TODO: Generate and return the JSON schema from ReleaseOutput.
-        # Hint: Use ReleaseOutput.model_json_schema()
-        # This is useful for including in the system prompt so the LLM
-        # knows exactly what format to produce.
-        return ReleaseOutput.model_json_schema()
+        return get_release_output_schema()
+
+    def _get_schema_json(self) -> str:
+        """Return the ReleaseOutput JSON schema pre-serialized as a string.
+
+        Useful for inlining the schema into prompts without re-serializing.
+
+        Returns:
+            The compact JSON encoding of the ReleaseOutput schema
+        """
+        return _RELEASE_OUTPUT_SCHEMA_JSON
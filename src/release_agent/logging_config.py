@@ -25,9 +25,12 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from functools import lru_cache
 from typing import Any
 
+import orjson
 import structlog
+from structlog.typing import EventDict
 
 
 def setup_logging(
@@ -50,48 +53,83 @@ def setup_logging(
     env = environment or os.environ.get("ENVIRONMENT", "development")
     level = log_level or os.environ.get("LOG_LEVEL", "INFO")
 
-    # 2. Configure structlog processors:
-    shared_processors = [
+    # 2. Processors shared by structlog and foreign (stdlib) log records:
+    shared_processors: list[Any] = [
         structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_logger_name,
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
     ]
 
-    # 3. Set up environment-specific rendering:
+    # 3. Environment-specific rendering:
     if env == "production":
-        # JSON output for Cloud Logging
-        renderer = structlog.processors.JSONRenderer()
+        # Minimal chain for Cloud Logging, rendered with orjson
+        shared_processors.append(structlog.processors.TimeStamper(fmt="iso", utc=True))
+        render_processors: list[Any] = [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ]
     else:
         # Pretty output for development
-        renderer = structlog.dev.ConsoleRenderer()
+        shared_processors += [
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+        ]
+        render_processors = [structlog.dev.ConsoleRenderer()]
 
-    # 4. Configure structlog:
+    # 4. Configure structlog to hand events to the stdlib handler below:
     structlog.configure(
         processors=[
+            structlog.stdlib.filter_by_level,
             *shared_processors,
-            structlog.processors.format_exc_info,
-            renderer,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, level.upper())
-        ),
+        wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
-    #
-    # 5. Also configure standard library logging (for third-party libs):
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, level.upper()),
+
+    # 5. Route standard library logging (third-party libs) through the same
+    #    renderer, so every record is formatted exactly once:
+    formatter = structlog.stdlib.ProcessorFormatter(
+        # ExtraAdder lifts logging `extra={...}` fields into the event dict
+        foreign_pre_chain=[
+            *shared_processors,
+            structlog.stdlib.ExtraAdder(),
+            _drop_record_message,
+        ],
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            *render_processors,
+        ],
     )
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(formatter)
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(getattr(logging, level.upper()))
 
 
+def _drop_record_message(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """Drop the pre-rendered ``message`` attribute QueueHandler leaves on records.
+
+    It duplicates ``event``; ``extra`` can never legitimately set it.
+    """
+    event_dict.pop("message", None)
+    return event_dict
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSON serializer for JSONRenderer backed by orjson."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> Any:
     """Get a structured logger instance.
 
+    Loggers are memoized per name, so calling this on a hot path is cheap.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -14,28 +14,64 @@ Architecture notes:
 To run locally:
     uvicorn release_agent.main:app --reload --port 8000
 
+In production, run on uvloop with the httptools parser:
+    uvicorn release_agent.main:app --loop uvloop --http httptools
+
+or use the bundled entry point, which also sizes the worker pool:
+    release-agent-api
+
 Then visit http://localhost:8000/docs for the interactive API docs.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import logging
+import os
+import queue
 import time
 import uuid
-from collections import defaultdict
-from collections.abc import AsyncGenerator
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Coroutine
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from time import perf_counter
+from typing import Annotated, Any
 
+import orjson
 import structlog
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from starlette.datastructures import MutableHeaders
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from release_agent.agent import ReleaseRiskAgent
-from release_agent.logging_config import setup_logging
+from release_agent.llm import LLMClient, LLMConfig
+from release_agent.logging_config import get_logger, setup_logging
+from release_agent.policy import DEFAULT_RULES
 from release_agent.prompts.assess_risk import build_system_prompt, build_user_prompt
-from release_agent.schemas import ReleaseInput, ReleaseOutput
+from release_agent.schemas import (
+    RELEASE_INPUT_LIST_ADAPTER,
+    BatchItemError,
+    ReleaseInput,
+    ReleaseOutput,
+)
+
+_logger = get_logger(__name__)
+
+# Per-request access log. In the running app its records go through a
+# QueueHandler (see lifespan) so the request path never blocks on stdout.
+_access_logger = logging.getLogger("release_agent.access")
 
 # ---------------------------------------------------------------------------
 # Application Lifespan (startup/shutdown)
@@ -52,16 +88,362 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # TODO: Initialize the ReleaseRiskAgent at startup.
     #
     # Steps:
-    # 1. Create the agent instance:
-    app.state.agent = ReleaseRiskAgent()
-    #
-    # 2. yield to let the app run
+    # 0. Configure logging, then hand access-log records to a background
+    #    thread that writes them with the root handlers:
     setup_logging()
-    yield
-    # 3. Clean up resources on shutdown (if any)
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    access_listener = QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    _access_logger.handlers = [QueueHandler(log_queue)]
+    _access_logger.propagate = False
+    access_listener.start()
+    #
+    # 1. Create the rate limiter. Counters go to Redis when REDIS_URL is set
+    #    (shared across workers), otherwise they stay in-process:
+    app.state.redis = None
+    if redis_url := os.environ.get("REDIS_URL"):
+        import redis.asyncio as aioredis
+
+        app.state.redis = aioredis.from_url(redis_url, max_connections=32)
+    app.state.rate_limiter = RateLimiter(
+        max_requests=int(os.environ.get("RATE_LIMIT_MAX_REQUESTS", "10")),
+        window_seconds=int(os.environ.get("RATE_LIMIT_WINDOW_SECONDS", "60")),
+        redis=app.state.redis,
+    )
+    #
+    # 2. Create the agent instance. The LLM client (and its HTTP connection
+    #    pool) is created once here and shared by every request:
+    app.state.llm = LLMClient(config=LLMConfig())
+    app.state.agent = ReleaseRiskAgent(llm=app.state.llm)
     #
-    # Hint: The agent is stateless, so cleanup is minimal.
-    # In Phase 7, you'll add logging setup and DB connections here.
+    # 3. Cache recent assessments. The namespace ties cache entries and
+    #    ETags to the model and policy rule set, so changing either
+    #    invalidates both:
+    app.state.assessment_namespace = _assessment_namespace(app.state.llm.config.model)
+    app.state.cache = AssessmentCache(
+        maxsize=int(os.environ.get("ASSESS_CACHE_SIZE", "4096")),
+        ttl_seconds=float(os.environ.get("ASSESS_CACHE_TTL_SECONDS", "600")),
+        namespace=app.state.assessment_namespace,
+    )
+    #
+    #    Cap how many batch assessments run at once so a large batch can't
+    #    flood the LLM provider (or memory) with in-flight requests:
+    app.state.assess_semaphore = asyncio.Semaphore(
+        int(os.environ.get("ASSESS_MAX_CONCURRENCY", "16"))
+    )
+    #
+    # 4. yield to let the app run
+    yield
+    # 5. Clean up resources on shutdown: close the shared connection pools.
+    await app.state.llm.aclose()
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+    access_listener.stop()
+    _access_logger.handlers = []
+    _access_logger.propagate = True
+
+# ---------------------------------------------------------------------------
+# Request Parsing
+# ---------------------------------------------------------------------------
+
+
+def _json_body[T](adapter: TypeAdapter[T]) -> Callable[[Request], Awaitable[T]]:
+    """Build a dependency that validates the raw JSON body in one pass.
+
+    FastAPI's own body handling decodes JSON to Python objects with the
+    stdlib and then validates them; pydantic-core's validate_json parses
+    and validates the bytes directly. Errors are re-raised as
+    RequestValidationError, so clients still get FastAPI's 422 format.
+    """
+
+    async def parse(request: Request) -> T:
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+            ) from e
+
+    return parse
+
+
+def _openapi_body(schema: dict[str, Any]) -> dict[str, Any]:
+    """openapi_extra documenting a JSON request body read via _json_body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
+_RELEASE_INPUT_REF = {"$ref": "#/components/schemas/ReleaseInput"}
+_release_body = _json_body(TypeAdapter(ReleaseInput))
+_release_list_body = _json_body(RELEASE_INPUT_LIST_ADAPTER)
+
+
+# ---------------------------------------------------------------------------
+# Response Serialization
+# ---------------------------------------------------------------------------
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson instead of the stdlib json module.
+
+    Defined here rather than imported from fastapi.responses, where it is
+    deprecated in newer releases.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+# Pydantic-core serializer for batch responses, built once
+_BATCH_RESULTS = TypeAdapter(list[ReleaseOutput | BatchItemError])
+
+
+def _model_response(body: bytes | str, etag: str | None = None) -> Response:
+    """Wrap already-serialized JSON in a Response.
+
+    Model routes return this directly so FastAPI doesn't re-validate and
+    re-encode the agent's (already validated) output.
+    """
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _assessment_namespace(model: str) -> str:
+    """Identify what produces an assessment: the LLM model and policy rule set."""
+    rules = ",".join(rule.__name__ for rule in DEFAULT_RULES)
+    return f"{model}|{rules}"
+
+
+def _input_etag(request: Request, *releases: ReleaseInput) -> str:
+    """Hash the submitted release(s) and the app's assessment namespace.
+
+    The namespace changes with the model or policy rule set, so clients
+    holding an ETag from before such a change get a fresh assessment.
+
+    Returns:
+        The hash as a quoted ETag value
+    """
+    namespace: str = getattr(request.app.state, "assessment_namespace", "")
+    digest = hashlib.blake2b(namespace.encode(), digest_size=16)
+    for release in releases:
+        digest.update(b"\0")
+        digest.update(release.model_dump_json().encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already covers this ETag.
+
+    ``*`` is deliberately not honoured: the ETag is derived from the request
+    body, not a stored resource, so there is no "any version" to match.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+# ---------------------------------------------------------------------------
+# Error Handling
+# ---------------------------------------------------------------------------
+# FastAPI's built-in handlers for HTTPException and request validation
+# render with the stdlib json module; these keep every error body on orjson.
+# They're registered through the FastAPI(exception_handlers=...) argument.
+
+
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> Response:
+    """Render HTTPExceptions (e.g. 422/500 raised by routes) with orjson."""
+    if exc.status_code in (204, 304) or exc.status_code < 200:
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=exc.headers,
+    )
+
+
+async def request_validation_handler(
+    request: Request, exc: RequestValidationError
+) -> ORJSONResponse:
+    """Render request-body validation errors (422) with orjson."""
+    return ORJSONResponse(
+        status_code=422,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
+
+
+async def value_error_handler(request: Request, exc: ValueError) -> ORJSONResponse:
+    """Handle ValueError exceptions (e.g., invalid LLM output)."""
+    return ORJSONResponse(
+        status_code=422,
+        content={"error": "validation_error", "detail": str(exc)},
+    )
+
+
+async def general_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Catch-all error handler for unexpected exceptions."""
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": "internal_error",
+            "detail": str(exc),
+        },
+    )
+
+
+_EXCEPTION_HANDLERS: dict[
+    int | type[Exception], Callable[[Request, Any], Coroutine[Any, Any, Response]]
+] = {
+    StarletteHTTPException: http_exception_handler,
+    RequestValidationError: request_validation_handler,
+    ValueError: value_error_handler,
+    Exception: general_error_handler,
+}
+
+
+# ---------------------------------------------------------------------------
+# Rate Limiting
+# ---------------------------------------------------------------------------
+
+
+class RateLimiter:
+    """Per-client sliding-window-counter rate limiter.
+
+    Requests are counted in fixed buckets of ``window_seconds``; the rolling
+    count is estimated as ``current + previous * (1 - elapsed_fraction)``,
+    so each check is O(1) regardless of traffic. With a Redis client the
+    counters live in Redis and the limit holds across all workers (one
+    pipelined INCR/EXPIRE/GET per check); otherwise they're kept in-process
+    and counters idle for two full windows are evicted once per window, so
+    the table can't grow without bound under a spray of client addresses.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 10,
+        window_seconds: int = 60,
+        redis: Any | None = None,
+    ):
+        self.max_requests = max_requests
+        self.window = window_seconds
+        self._redis = redis
+        # client -> (bucket, count in bucket, count in previous bucket)
+        self._counts: dict[str, tuple[int, int, int]] = {}
+        self._swept_bucket = 0
+
+    async def is_allowed(self, client_ip: str) -> bool:
+        now = time.time()
+        bucket = int(now // self.window)
+        if self._redis is not None:
+            try:
+                current, previous = await self._hit_redis(client_ip, bucket)
+            except Exception as e:
+                # Fail open: an unavailable limiter shouldn't take the API down
+                _logger.warning("rate_limiter_unavailable", error=str(e))
+                return True
+        else:
+            current, previous = self._hit_local(client_ip, bucket)
+
+        elapsed = (now % self.window) / self.window
+        return current + previous * (1 - elapsed) <= self.max_requests
+
+    def retry_after(self) -> int:
+        """Seconds until the current bucket rolls over."""
+        return int(self.window - time.time() % self.window) + 1
+
+    async def _hit_redis(self, client_ip: str, bucket: int) -> tuple[int, int]:
+        assert self._redis is not None
+        key = f"ratelimit:{client_ip}:{bucket}"
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, self.window * 2)
+            pipe.get(f"ratelimit:{client_ip}:{bucket - 1}")
+            current, _, previous = await pipe.execute()
+        return int(current), int(previous or 0)
+
+    def _hit_local(self, client_ip: str, bucket: int) -> tuple[int, int]:
+        if bucket != self._swept_bucket:
+            self._evict_idle(bucket)
+        last_bucket, count, prev_count = self._counts.get(client_ip, (bucket, 0, 0))
+        if last_bucket == bucket - 1:
+            count, prev_count = 0, count
+        elif last_bucket < bucket - 1:
+            count, prev_count = 0, 0
+        count += 1
+        self._counts[client_ip] = (bucket, count, prev_count)
+        return count, prev_count
+
+    def _evict_idle(self, bucket: int) -> None:
+        """Drop counters that no longer affect any estimate (older than bucket - 1)."""
+        self._swept_bucket = bucket
+        self._counts = {
+            ip: entry for ip, entry in self._counts.items() if entry[0] >= bucket - 1
+        }
+
+
+class RateLimitMiddleware:
+    """Reject clients over the limit with 429 + Retry-After.
+
+    Uses the limiter created in lifespan; /health is never limited. A plain
+    ASGI middleware like AccessLogMiddleware, so allowed requests pass
+    straight through without a BaseHTTPMiddleware task and body stream.
+
+    Args:
+        app: The wrapped ASGI app
+        trusted_proxy_hops: Number of reverse proxies in front of the app
+            that append to X-Forwarded-For. Defaults to the
+            RATE_LIMIT_TRUSTED_PROXY_HOPS env var, or 0.
+    """
+
+    def __init__(self, app: ASGIApp, trusted_proxy_hops: int | None = None) -> None:
+        self.app = app
+        if trusted_proxy_hops is None:
+            trusted_proxy_hops = int(os.environ.get("RATE_LIMIT_TRUSTED_PROXY_HOPS", "0"))
+        self.trusted_proxy_hops = trusted_proxy_hops
+
+    def client_address(self, scope: Scope) -> str:
+        """The address to rate-limit on.
+
+        Behind N trusted proxies (RATE_LIMIT_TRUSTED_PROXY_HOPS), each appends
+        the address it received the request from to X-Forwarded-For, so the
+        Nth entry from the right is the real client. Entries further left are
+        client-supplied and never used. With no trusted proxies (the default)
+        the TCP peer address is used as-is.
+        """
+        if self.trusted_proxy_hops > 0:
+            forwarded = [
+                value.decode("latin-1")
+                for name, value in scope["headers"]
+                if name == b"x-forwarded-for"
+            ]
+            hops = [hop.strip() for hop in ",".join(forwarded).split(",") if hop.strip()]
+            if len(hops) >= self.trusted_proxy_hops:
+                return hops[-self.trusted_proxy_hops]
+        return scope["client"][0] if scope.get("client") else "unknown"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] != "/health":
+            limiter: RateLimiter | None = getattr(
+                scope["app"].state, "rate_limiter", None
+            )
+            client_ip = self.client_address(scope)
+            if limiter is not None and not await limiter.is_allowed(client_ip):
+                response = ORJSONResponse(
+                    status_code=429,
+                    content={"error": "rate_limited", "detail": "Too many requests"},
+                    headers={"Retry-After": str(limiter.retry_after())},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
 
 # ---------------------------------------------------------------------------
 # FastAPI App
@@ -72,6 +454,8 @@ app = FastAPI(
     description="AI-powered release risk assessment service",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    exception_handlers=_EXCEPTION_HANDLERS,
 )
 
 # TODO: Configure CORS middleware.
@@ -88,6 +472,10 @@ app = FastAPI(
 #
 # Hint: In production (Phase 7), you'll restrict allow_origins
 # to your actual frontend domain.
+#
+# The last middleware added runs outermost. The rate limiter is added first
+# so its 429s still pass through CORS, request IDs and the access log.
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -96,6 +484,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger bodies (batch results mostly); JSON shrinks several-fold
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
 class RequestIDMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request, call_next):
         request_id = str(uuid.uuid4())
@@ -105,70 +497,161 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         response.headers["X-Request-ID"] = request_id
         return response
 
+
 app.add_middleware(RequestIDMiddleware)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        start = time.time()
-        response = await call_next(request)
-        duration = time.time() - start
-        print(
-            f"{request.method} {request.url.path} "
-            f"-> {response.status_code} ({duration:.2f}s)"
-        )
-        return response
+class AccessLogMiddleware:
+    """Times each request, sets X-Process-Time and writes one access log line.
 
-app.add_middleware(LoggingMiddleware)
+    A plain ASGI middleware (not BaseHTTPMiddleware), so it adds a single
+    call frame per request and never wraps or buffers the response body.
+    """
 
-class RateLimiter:
-    def __init__(self, max_requests: int = 10, window_seconds: int = 60):
-        self.max_requests = max_requests
-        self.window = window_seconds
-        self.requests: dict[str, list[float]] = defaultdict(list)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    def is_allowed(self, client_ip: str) -> bool:
-        now = time.time()
-        # Remove old entries
-        self.requests[client_ip] = [
-            t for t in self.requests[client_ip]
-            if now - t < self.window
-        ]
-        if len(self.requests[client_ip]) >= self.max_requests:
-            return False
-        self.requests[client_ip].append(now)
-        return True
-
-class TimingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        start = time.time()
-        response = await call_next(request)
-        duration = time.time() - start
-        response.headers["X-Process-Time"] = f"{duration:.2f}s"
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-# ---------------------------------------------------------------------------
-# Error Handling
-# ---------------------------------------------------------------------------
-@app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
-    """Handle ValueError exceptions (e.g., invalid LLM output)."""
-    return JSONResponse(
-        status_code=422,
-        content={"error": "validation_error", "detail": str(exc)},
-    )
+        start = perf_counter()
+        status = 500
 
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{perf_counter() - start:.4f}s")
+            await send(message)
 
-@app.exception_handler(Exception)
-async def general_error_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Catch-all error handler for unexpected exceptions."""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "internal_error",
-            "detail": str(exc),
-        },
-    )
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _access_logger.info(
+                "access",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "dur_ms": round((perf_counter() - start) * 1000, 2),
+                },
+            )
+
+
+app.add_middleware(AccessLogMiddleware)
+
+
+@dataclass(slots=True)
+class _InFlight:
+    """A running assessment and how many callers are awaiting it."""
+
+    task: asyncio.Task[ReleaseOutput]
+    waiters: int = 0
+
+
+class AssessmentCache:
+    """In-process TTL + LRU cache of assessments keyed by input content.
+
+    Keys hash the canonical input JSON together with a namespace (model and
+    policy rule set), so changing either one invalidates earlier entries.
+    Also tracks in-flight assessments so concurrent identical requests
+    share a single agent call (see get_or_assess).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl_seconds: float = 600.0,
+        namespace: str = "",
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl_seconds
+        self._namespace = namespace.encode()
+        self._entries: OrderedDict[str, tuple[float, ReleaseOutput]] = OrderedDict()
+        self._inflight: dict[str, _InFlight] = {}
+
+    def key(self, release: ReleaseInput) -> str:
+        digest = hashlib.sha256(self._namespace)
+        digest.update(b"\0")
+        digest.update(release.model_dump_json().encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> ReleaseOutput | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: ReleaseOutput) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_assess(
+        self, key: str, assess: Callable[[], Awaitable[ReleaseOutput]]
+    ) -> ReleaseOutput:
+        """Return the cached result for key, or run assess() to produce it.
+
+        Callers asking for a key that is already being assessed join that
+        call instead of starting another. One cancelled caller doesn't
+        cancel the shared call for the others, but once every caller
+        waiting on it has been cancelled, the call is cancelled too.
+
+        Args:
+            key: Cache key from key()
+            assess: Starts the assessment; only called on a miss with no
+                call in flight
+
+        Returns:
+            The cached, joined or fresh assessment
+        """
+        if (cached := self.get(key)) is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = _InFlight(asyncio.ensure_future(assess()))
+            self._inflight[key] = inflight
+            inflight.task.add_done_callback(functools.partial(self._finish, key))
+
+        inflight.waiters += 1
+        try:
+            return await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if inflight.waiters == 0 and not inflight.task.done():
+                # Untrack now so a new caller starts fresh instead of joining
+                # a call that is being cancelled
+                self._inflight.pop(key, None)
+                inflight.task.cancel()
+
+    def _finish(self, key: str, task: asyncio.Task[ReleaseOutput]) -> None:
+        """Done callback: stop tracking the call and cache a successful result."""
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.task is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result())
+
+
+async def _assess_cached(
+    agent: ReleaseRiskAgent,
+    release: ReleaseInput,
+    cache: AssessmentCache | None,
+) -> ReleaseOutput:
+    """Run agent.assess, serving repeat inputs from the cache when present."""
+    if cache is None:
+        return await agent.assess(release)
+    return await cache.get_or_assess(cache.key(release), lambda: agent.assess(release))
 
 
 # ---------------------------------------------------------------------------
@@ -193,21 +676,37 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
-@app.post("/assess", response_model=ReleaseOutput)
-async def assess_release(release: ReleaseInput, request: Request) -> ReleaseOutput:
+@app.post(
+    "/assess",
+    response_model=ReleaseOutput,
+    openapi_extra=_openapi_body(_RELEASE_INPUT_REF),
+)
+async def assess_release(
+    release: Annotated[ReleaseInput, Depends(_release_body)],
+    request: Request,
+) -> Response:
     """Assess the risk of a release.
 
     This is the main endpoint. It:
-    1. Validates the input (FastAPI does this automatically via Pydantic)
+    1. Validates the input (straight from the JSON bytes, via pydantic-core)
     2. Passes the data to the agent
     3. Returns the structured risk assessment
 
+    Re-submissions of an identical payload with a matching If-None-Match
+    header get a 304 without invoking the agent, and payloads assessed
+    recently are served from the in-process result cache.
+
+    The 304 on POST is a deliberate departure from RFC 9110, which asks
+    for 412 when If-None-Match fails on a method other than GET/HEAD.
+    Assessment is a side-effect-free lookup keyed on the body, so a match
+    means "your copy is still current", which is what 304 says.
+
     Args:
-        release: The release data to assess (validated by FastAPI)
+        release: The release data to assess (validated from the raw body)
         request: The incoming HTTP request (for accessing app state)
 
     Returns:
-        A ReleaseOutput with the risk assessment
+        The ReleaseOutput risk assessment, serialized by pydantic-core
 
     Raises:
         HTTPException: If the agent fails to produce a valid assessment
@@ -228,48 +727,165 @@ async def assess_release(release: ReleaseInput, request: Request) -> ReleaseOutp
     #
     # 3. Return the result (FastAPI serializes it automatically):
     #    return result
+    etag = _input_etag(request, release)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     agent: ReleaseRiskAgent = request.app.state.agent
+    cache: AssessmentCache | None = getattr(request.app.state, "cache", None)
     try:
-        result = await agent.assess(release)
+        result = await _assess_cached(agent, release, cache)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Assessment failed: {e}") from e
-    return result
+    return _model_response(result.model_dump_json(), etag)
+
 
-@app.post("/assess/batch", response_model=list[ReleaseOutput])
+def _batch_item(result: ReleaseOutput | BaseException) -> ReleaseOutput | BatchItemError:
+    """Map one gathered batch result to its response item."""
+    if isinstance(result, ReleaseOutput):
+        return result
+    if isinstance(result, ValueError):
+        return BatchItemError(error="validation_error", detail=str(result))
+    if isinstance(result, Exception):
+        return BatchItemError(error="assessment_failed", detail=str(result))
+    raise result
+
+
+@app.post(
+    "/assess/batch",
+    response_model=list[ReleaseOutput | BatchItemError],
+    openapi_extra=_openapi_body({"type": "array", "items": _RELEASE_INPUT_REF}),
+)
 async def assess_batch(
-    releases: list[ReleaseInput],
+    releases: Annotated[list[ReleaseInput], Depends(_release_list_body)],
     request: Request,
-) -> list[ReleaseOutput]:
+) -> Response:
     """Assess multiple releases concurrently.
 
     Accepts a JSON array of ReleaseInput objects and returns a
-    corresponding array of ReleaseOutput objects. Assessments run
-    concurrently using asyncio.gather for efficiency.
+    corresponding array of results. Assessments run concurrently using
+    asyncio.gather, bounded by the app's assessment semaphore; a release
+    that fails yields a BatchItemError in its slot instead of failing the
+    whole batch. Like /assess, an unchanged batch with a matching
+    If-None-Match returns 304 (not the 412 RFC 9110 prescribes for POST;
+    see assess_release), and each release is looked up in the result
+    cache before calling the agent.
+
+    Clients that send ``Accept: application/x-ndjson`` instead get one
+    line per release as soon as it finishes (completion order), each
+    tagged with its position in the request:
+    ``{"index": 0, "result": {...}}`` or
+    ``{"index": 1, "error": "...", "detail": "..."}``.
     """
+    etag = _input_etag(request, *releases)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     agent: ReleaseRiskAgent = request.app.state.agent
+    cache: AssessmentCache | None = getattr(request.app.state, "cache", None)
+
+    # Run assessments concurrently, at most ASSESS_MAX_CONCURRENCY at a time
+    semaphore: asyncio.Semaphore | None = getattr(
+        request.app.state, "assess_semaphore", None
+    )
+
+    async def bounded(release: ReleaseInput) -> ReleaseOutput:
+        if semaphore is None:
+            return await _assess_cached(agent, release, cache)
+        async with semaphore:
+            return await _assess_cached(agent, release, cache)
+
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_batch(releases, bounded),
+            media_type="application/x-ndjson",
+            headers={"ETag": etag},
+        )
+
+    tasks = [bounded(release) for release in releases]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    items = [_batch_item(result) for result in results]
+
+    return _model_response(_BATCH_RESULTS.dump_json(items), etag)
 
-    # Run all assessments concurrently
-    tasks = [agent.assess(release) for release in releases]
 
+async def _stream_batch(
+    releases: list[ReleaseInput],
+    assess: Callable[[ReleaseInput], Awaitable[ReleaseOutput]],
+) -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per assessment, in completion order.
+
+    Assessments are started on the first iteration, not when the response
+    is built, so a client that disconnects before the body is read leaves
+    nothing scheduled or un-awaited.
+    """
+
+    async def indexed(i: int, release: ReleaseInput) -> tuple[int, ReleaseOutput | Exception]:
+        try:
+            return i, await assess(release)
+        except Exception as e:
+            return i, e
+
+    tasks = [asyncio.ensure_future(indexed(i, release)) for i, release in enumerate(releases)]
     try:
-        results = await asyncio.gather(*tasks)
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Batch assessment failed: {e}") from e
+        for next_done in asyncio.as_completed(tasks):
+            i, result = await next_done
+            item = _batch_item(result)
+            line: dict[str, Any] = {"index": i}
+            if isinstance(item, ReleaseOutput):
+                line["result"] = item.model_dump(mode="json")
+            else:
+                line.update(item.model_dump(mode="json"))
+            yield orjson.dumps(line, option=orjson.OPT_APPEND_NEWLINE)
+    finally:
+        # Client went away mid-stream: cancel our waits. Assessments no
+        # other request is waiting on are cancelled with them.
+        for task in tasks:
+            task.cancel()
+
+
+# The system prompt is static, so its dry-run stats are computed once
+_SYSTEM_PROMPT_LENGTH = len(build_system_prompt())
+_SYSTEM_PROMPT_PREVIEW = build_system_prompt()[:500]
 
-    return list(results)
 
 @app.post("/assess/dry-run")
 async def dry_run(release: ReleaseInput) -> dict:
-    system_prompt = build_system_prompt()
     user_prompt = build_user_prompt(release)
     return {
         "valid": True,
-        "system_prompt_length": len(system_prompt),
+        "system_prompt_length": _SYSTEM_PROMPT_LENGTH,
         "user_prompt_length": len(user_prompt),
-        "system_prompt_preview": system_prompt[:500],
+        "system_prompt_preview": _SYSTEM_PROMPT_PREVIEW,
         "user_prompt_preview": user_prompt[:500],
     }
+
+
+# ---------------------------------------------------------------------------
+# Entry Point
+# ---------------------------------------------------------------------------
+
+
+def run() -> None:
+    """Serve the API with uvicorn on uvloop + httptools.
+
+    Worker count comes from WEB_CONCURRENCY, defaulting to 2 * CPUs + 1.
+    Bind address is HOST/PORT (default 0.0.0.0:8080).
+    """
+    import uvicorn
+
+    workers = int(os.environ.get("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+    uvicorn.run(
+        "release_agent.main:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8080")),
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -21,9 +21,13 @@ Architecture:
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_left
 from collections.abc import Callable
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -33,9 +37,15 @@ from release_agent.schemas import (
     Decision,
     ReleaseInput,
     ReleaseOutput,
+    RiskFactor,
     RiskLevel,
 )
 
+# Upper bounds (inclusive) of each risk level's score band, used to map an
+# adjusted risk_score back to a RiskLevel with a single bisect.
+_RISK_THRESHOLDS = (0.3, 0.5, 0.7)
+_RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
 # ---------------------------------------------------------------------------
 # Policy Types
 # ---------------------------------------------------------------------------
@@ -92,9 +102,17 @@ class PolicyConfig(BaseModel):
     rules: dict[str, RuleConfig] = {}
 
 
+# Shared, read-only default used whenever no policy file applies
+_DEFAULT_POLICY_CONFIG = PolicyConfig()
+
+
 def load_policy_config(path: str | Path) -> PolicyConfig:
     """Load and validate a YAML policy config file.
 
+    Parsed configs are cached per file and reused until the file's mtime or
+    size changes, so repeated calls don't re-read and re-validate the YAML.
+    Treat the returned config as read-only.
+
     Args:
         path: Path to the YAML configuration file.
 
@@ -105,11 +123,22 @@ def load_policy_config(path: str | Path) -> PolicyConfig:
         ValueError: If the YAML content is invalid or fails validation.
     """
     config_path = Path(path)
-    if not config_path.exists():
-        return PolicyConfig()
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        return _DEFAULT_POLICY_CONFIG
+    return _load_policy_config_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
+
 
+# Use libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _load_policy_config_cached(path: str, mtime_ns: int, size: int) -> PolicyConfig:
+    """Parse and validate a policy file; mtime/size only key the cache."""
     try:
-        raw = yaml.safe_load(config_path.read_text()) or {}
+        raw = yaml.load(Path(path).read_text(), Loader=_YAML_LOADER) or {}
     except yaml.YAMLError as exc:
         raise ValueError(f"Invalid YAML in {path}: {exc}") from exc
 
@@ -123,11 +152,161 @@ def load_policy_config(path: str | Path) -> PolicyConfig:
 PolicyRule = Callable[[ReleaseOutput, ReleaseInput, RuleConfig | None], PolicyViolation | None]
 
 
+def requires(*fields: str) -> Callable[[PolicyRule], PolicyRule]:
+    """Declare the ReleaseInput fields a rule needs to have anything to check.
+
+    apply_policies() skips the rule without calling it when any of these
+    fields is empty, e.g. file-based rules on a release with no changed
+    files. Only use it for rules that can never fire in that case.
+
+    Args:
+        *fields: Names of ReleaseInput attributes that must be truthy
+
+    Returns:
+        A decorator that records the fields on the rule as ``_requires``
+    """
+
+    def decorator(rule: PolicyRule) -> PolicyRule:
+        rule._requires = fields  # type: ignore[attr-defined]
+        return rule
+
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Path Pattern Matching
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile substring patterns into a single alternation regex.
+
+    One regex search per path replaces a Python-level loop over patterns.
+    Configured pattern lists are compiled once and reused.
+
+    Args:
+        patterns: Literal substrings to look for (matched case-sensitively,
+            so callers pass lowercased paths)
+
+    Returns:
+        A compiled pattern; never matches if ``patterns`` is empty
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+_MIGRATION_PATTERNS = ("migration", "alembic", "flyway", "liquibase")
+_AUTH_PATTERNS = ("auth", "login", "session", "token", "oauth",
+                  "permission", "rbac", "acl")
+_MIGRATION_RE = _compile_patterns(_MIGRATION_PATTERNS)
+_AUTH_RE = _compile_patterns(_AUTH_PATTERNS)
+_INFRA_PREFIXES = ("terraform/", "k8s/", "infra/", "infrastructure/", "helm/",
+                   "ansible/", "cloudformation/")
+_INFRA_SUFFIXES = (".tf", ".tfvars")
+_SOURCE_PREFIXES = ("src/", "lib/", "app/")
+
+
+@dataclass
+class _FileScan:
+    """Classification of a release's changed files, shared by file-based rules.
+
+    Built in one pass over ``files_changed`` so each path is lowercased and
+    classified once, no matter how many rules look at it.
+    """
+
+    input_data: ReleaseInput
+    lower_paths: list[str]
+    migration_files: list[str]
+    auth_files: list[str]
+    infra_files: list[str]
+    total_lines: int
+    has_source: bool
+    has_test: bool
+
+
+def _scan_files(input_data: ReleaseInput) -> _FileScan:
+    """Classify every changed file against the default rule patterns."""
+    lower_paths: list[str] = []
+    migration_files: list[str] = []
+    auth_files: list[str] = []
+    infra_files: list[str] = []
+    total_lines = 0
+    has_source = False
+    has_test = False
+    migration_search = _MIGRATION_RE.search
+    auth_search = _AUTH_RE.search
+
+    for f in input_data.files_changed:
+        path = f.path
+        lowered = path.lower()
+        lower_paths.append(lowered)
+        if migration_search(lowered):
+            migration_files.append(path)
+        if auth_search(lowered):
+            auth_files.append(path)
+        if path.startswith(_INFRA_PREFIXES) or path.endswith(_INFRA_SUFFIXES):
+            infra_files.append(path)
+        total_lines += f.additions + f.deletions
+        has_source = has_source or path.startswith(_SOURCE_PREFIXES)
+        has_test = has_test or "test" in lowered
+
+    return _FileScan(
+        input_data=input_data,
+        lower_paths=lower_paths,
+        migration_files=migration_files,
+        auth_files=auth_files,
+        infra_files=infra_files,
+        total_lines=total_lines,
+        has_source=has_source,
+        has_test=has_test,
+    )
+
+
+@dataclass
+class _ScanSlot:
+    """Holds the file scan for one apply_policies() call, built on first use."""
+
+    scan: _FileScan | None = None
+
+
+# Slot for the release currently being evaluated by apply_policies()
+_current_scan: ContextVar[_ScanSlot | None] = ContextVar("_current_scan", default=None)
+
+
+def _get_scan(input_data: ReleaseInput) -> _FileScan:
+    """Return the shared scan for this release, computing it if needed.
+
+    Inside apply_policies() the scan is built by the first file-based rule
+    and reused by the rest (and skipped entirely if no such rule runs);
+    rules called directly (e.g. in tests) scan on demand.
+    """
+    slot = _current_scan.get()
+    if slot is None:
+        return _scan_files(input_data)
+    if slot.scan is None or slot.scan.input_data is not input_data:
+        slot.scan = _scan_files(input_data)
+    return slot.scan
+
+
+def _match_files(input_data: ReleaseInput, matcher: re.Pattern[str]) -> list[str]:
+    """Return the paths of changed files whose lowercased path matches."""
+    scan = _get_scan(input_data)
+    search = matcher.search
+    return [
+        f.path
+        for f, lowered in zip(input_data.files_changed, scan.lower_paths, strict=True)
+        if search(lowered)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Policy Rules
 # ---------------------------------------------------------------------------
 
 
+@requires("ci_results")
 def rule_ci_failures(
     output: ReleaseOutput, input_data: ReleaseInput, config: RuleConfig | None = None
 ) -> PolicyViolation | None:
@@ -153,15 +332,14 @@ def rule_ci_failures(
     #
     # 3. If all passed, return None (no violation)
     #    return None
-    failed_checks = [ci for ci in input_data.ci_results if not ci.passed]
-
-    if failed_checks:
-            names = ", ".join(ci.name for ci in failed_checks)
-            return PolicyViolation(
-                rule_name="ci_failures",
-                action=PolicyAction.FORCE_NO_GO,
-                reason=f"CI checks failed: {names}",
-            )
+    # Stop at the first failure; names are only collected when one exists
+    if any(not ci.passed for ci in input_data.ci_results):
+        names = ", ".join(ci.name for ci in input_data.ci_results if not ci.passed)
+        return PolicyViolation(
+            rule_name="ci_failures",
+            action=PolicyAction.FORCE_NO_GO,
+            reason=f"CI checks failed: {names}",
+        )
 
     return None
 
@@ -186,6 +364,7 @@ def rule_high_risk_threshold(
     return None
 
 
+@requires("files_changed")
 def rule_database_migration(
     output: ReleaseOutput, input_data: ReleaseInput, config: RuleConfig | None = None
 ) -> PolicyViolation | None:
@@ -195,17 +374,14 @@ def rule_database_migration(
     hard to roll back. If we detect migration files, we increase the
     risk score to ensure the LLM (and humans) pay attention.
     """
-    default_patterns = ["migration", "alembic", "flyway", "liquibase"]
-    patterns = config.patterns if config and config.patterns is not None else default_patterns
     risk_adj = config.risk_adjustment if config and config.risk_adjustment is not None else 0.15
-
-    migration_files = [
-        f for f in input_data.files_changed
-        if any(pattern in f.path.lower() for pattern in patterns)
-    ]
+    if config and config.patterns is not None:
+        migration_files = _match_files(input_data, _compile_patterns(tuple(config.patterns)))
+    else:
+        migration_files = _get_scan(input_data).migration_files
 
     if migration_files:
-        paths = ", ".join(f.path for f in migration_files)
+        paths = ", ".join(migration_files)
         return PolicyViolation(
             rule_name="database_migration",
             action=PolicyAction.ADJUST_RISK,
@@ -215,6 +391,7 @@ def rule_database_migration(
     return None
 
 
+@requires("files_changed")
 def rule_auth_changes(
     output: ReleaseOutput, input_data: ReleaseInput, config: RuleConfig | None = None
 ) -> PolicyViolation | None:
@@ -223,18 +400,14 @@ def rule_auth_changes(
     Rationale: Auth code is security-critical. Changes here have outsized
     blast radius because they affect every user and every request.
     """
-    default_patterns = ["auth", "login", "session", "token", "oauth",
-                        "permission", "rbac", "acl"]
-    patterns = config.patterns if config and config.patterns is not None else default_patterns
     risk_adj = config.risk_adjustment if config and config.risk_adjustment is not None else 0.05
-
-    auth_files = [
-        f for f in input_data.files_changed
-        if any(pattern in f.path.lower() for pattern in patterns)
-    ]
+    if config and config.patterns is not None:
+        auth_files = _match_files(input_data, _compile_patterns(tuple(config.patterns)))
+    else:
+        auth_files = _get_scan(input_data).auth_files
 
     if auth_files:
-        paths = ", ".join(f.path for f in auth_files)
+        paths = ", ".join(auth_files)
         return PolicyViolation(
             rule_name="auth_changes",
             action=PolicyAction.ADJUST_RISK,
@@ -245,6 +418,7 @@ def rule_auth_changes(
     return None
 
 
+@requires("recent_incidents")
 def rule_deploy_during_incident(
     output: ReleaseOutput, input_data: ReleaseInput, config: RuleConfig | None = None
 ) -> PolicyViolation | None:
@@ -278,6 +452,7 @@ def rule_deploy_during_incident(
     return None
 
 
+@requires("files_changed")
 def rule_large_pr(
     output: ReleaseOutput, input_data: ReleaseInput, config: RuleConfig | None = None
 ) -> PolicyViolation | None:
@@ -290,9 +465,7 @@ def rule_large_pr(
     threshold = config.threshold if config and config.threshold is not None else 500
     risk_adj = config.risk_adjustment if config and config.risk_adjustment is not None else 0.1
 
-    total_lines = sum(
-        f.additions + f.deletions for f in input_data.files_changed
-    )
+    total_lines = _get_scan(input_data).total_lines
     if total_lines > threshold:
         return PolicyViolation(
             rule_name="large_pr",
@@ -302,6 +475,8 @@ def rule_large_pr(
         )
     return None
 
+
+@requires("files_changed")
 def rule_infra_changes(
     output: ReleaseOutput, input_data: ReleaseInput, config: RuleConfig | None = None
 ) -> PolicyViolation | None:
@@ -312,21 +487,12 @@ def rule_infra_changes(
     roll back and can take down entire services. A cluster upgrade that
     destroys node pools is qualitatively different from a code change.
     """
-    default_patterns = ["terraform", ".tf", "k8s", "kubernetes", "helm", "ansible",
-                        "cloudformation", ".yaml", "kustomize"]
-    infra_paths = ["terraform/", "k8s/", "infra/", "infrastructure/", "helm/",
-                   "ansible/", "cloudformation/"]
-    patterns = config.patterns if config and config.patterns is not None else default_patterns
     risk_adj = config.risk_adjustment if config and config.risk_adjustment is not None else 0.2
 
-    infra_files = [
-        f for f in input_data.files_changed
-        if any(f.path.startswith(p) for p in infra_paths)
-        or any(f.path.endswith(p) for p in [".tf", ".tfvars"])
-    ]
+    infra_files = _get_scan(input_data).infra_files
 
     if infra_files:
-        paths = ", ".join(f.path for f in infra_files)
+        paths = ", ".join(infra_files)
         return PolicyViolation(
             rule_name="infra_changes",
             action=PolicyAction.ADJUST_RISK,
@@ -336,6 +502,7 @@ def rule_infra_changes(
     return None
 
 
+@requires("files_changed")
 def rule_no_tests(
     output: ReleaseOutput, input_data: ReleaseInput, config: RuleConfig | None = None
 ) -> PolicyViolation | None:
@@ -345,15 +512,8 @@ def rule_no_tests(
     existing tests already cover the change (great) or you forgot to
     add tests (not great). Either way, a human should verify.
     """
-    paths = [f.path for f in input_data.files_changed]
-    has_source_changes = any(
-        p.startswith("src/") or p.startswith("lib/") or p.startswith("app/")
-        for p in paths
-    )
-    has_test_changes = any(
-        "test" in p.lower() for p in paths
-    )
-    if has_source_changes and not has_test_changes:
+    scan = _get_scan(input_data)
+    if scan.has_source and not scan.has_test:
         return PolicyViolation(
             rule_name="no_tests",
             action=PolicyAction.ADD_WARNING,
@@ -367,10 +527,14 @@ def rule_no_tests(
 # Policy Engine
 # ---------------------------------------------------------------------------
 
-# Default rules applied in order
-DEFAULT_RULES: list[PolicyRule] = [
+# Cheap checks that force NO_GO by default (RuleConfig.action can override)
+HARD_RULES: list[PolicyRule] = [
     rule_ci_failures,
     rule_high_risk_threshold,
+]
+
+# Rules that adjust risk or add warnings by default (most scan changed files)
+SOFT_RULES: list[PolicyRule] = [
     rule_database_migration,
     rule_auth_changes,
     rule_infra_changes,
@@ -378,6 +542,33 @@ DEFAULT_RULES: list[PolicyRule] = [
     rule_large_pr,
 ]
 
+# Default rules in evaluation order; every enabled rule runs
+DEFAULT_RULES: list[PolicyRule] = [*HARD_RULES, *SOFT_RULES]
+
+
+@dataclass(slots=True)
+class _BoundRule:
+    """A rule paired with its config overrides and required inputs."""
+
+    fn: PolicyRule
+    cfg: RuleConfig | None
+    requires: tuple[str, ...]
+
+
+def _bind_rules(rules: list[PolicyRule], policy_config: PolicyConfig) -> list[_BoundRule]:
+    """Pair each enabled rule with its config overrides and required inputs.
+
+    Resolved once per apply_policies() call so the rule loop itself does
+    no config lookups. Rules disabled in the config are dropped here.
+    """
+    bound = []
+    for rule in rules:
+        rule_cfg = policy_config.rules.get(rule.__name__)
+        if rule_cfg and not rule_cfg.enabled:
+            continue
+        bound.append(_BoundRule(rule, rule_cfg, getattr(rule, "_requires", ())))
+    return bound
+
 
 def apply_policies(
     output: ReleaseOutput,
@@ -410,78 +601,75 @@ def apply_policies(
     rules = rules or DEFAULT_RULES
 
     # Load config if a path was provided
-    policy_config = load_policy_config(config_path) if config_path else PolicyConfig()
+    policy_config = load_policy_config(config_path) if config_path else _DEFAULT_POLICY_CONFIG
 
-    # 2. Make a mutable copy of the output:
-    data = output.model_dump()
+    # 2. Make a shallow copy of the output. Only the lists we append to are
+    #    copied; the LLM's original ReleaseOutput is never mutated:
+    result = output.model_copy(update={
+        "risk_factors": list(output.risk_factors),
+        "recommended_actions": list(output.recommended_actions),
+    })
 
-    # 3. Collect all violations:
+    # 3. Collect all violations. The file-based rules share one scan of the
+    #    changed files, built the first time one of them needs it:
     violations = []
-    for rule in rules:
-        rule_name = rule.__name__
-        rule_cfg = policy_config.rules.get(rule_name)
-
-        # Skip disabled rules
-        if rule_cfg and not rule_cfg.enabled:
-            continue
+    scan_token = _current_scan.set(_ScanSlot())
+    try:
+        for bound in _bind_rules(rules, policy_config):
+            # Skip rules whose inputs are empty; they can't find anything
+            if bound.requires and not all(getattr(input_data, f) for f in bound.requires):
+                continue
 
-        violation = rule(output, input_data, rule_cfg)
-        if violation is not None:
-            violations.append(violation)
+            violation = bound.fn(output, input_data, bound.cfg)
+            if violation is not None:
+                violations.append(violation)
+    finally:
+        _current_scan.reset(scan_token)
 
     # 4. Apply each violation:
     for v in violations:
         if v.action == PolicyAction.FORCE_NO_GO:
-            data["decision"] = Decision.NO_GO
-            data["risk_factors"].append({
-                "category": "policy",
-                "description": f"[POLICY: {v.rule_name}] {v.reason}",
-                "severity": RiskLevel.CRITICAL,
-            })
+            result.decision = Decision.NO_GO
+            result.risk_factors.append(RiskFactor(
+                category="policy",
+                description=f"[POLICY: {v.rule_name}] {v.reason}",
+                severity=RiskLevel.CRITICAL,
+            ))
 
         elif v.action == PolicyAction.ADJUST_RISK:
-            data["risk_score"] = min(1.0, data["risk_score"] + v.risk_adjustment)
-            data["risk_factors"].append({
-                "category": "policy",
-                "description": f"[POLICY: {v.rule_name}] {v.reason}",
-                "severity": RiskLevel.HIGH,
-            })
+            result.risk_score = min(1.0, max(0.0, result.risk_score + v.risk_adjustment))
+            result.risk_factors.append(RiskFactor(
+                category="policy",
+                description=f"[POLICY: {v.rule_name}] {v.reason}",
+                severity=RiskLevel.HIGH,
+            ))
 
         elif v.action == PolicyAction.ADD_WARNING:
-            data["recommended_actions"].append(
+            result.recommended_actions.append(
                 f"[POLICY: {v.rule_name}] {v.reason}"
             )
 
     # 5. Recalculate risk_level based on adjusted risk_score:
-    score = data["risk_score"]
-    if score <= 0.3:
-        data["risk_level"] = RiskLevel.LOW
-    elif score <= 0.5:
-        data["risk_level"] = RiskLevel.MEDIUM
-    elif score <= 0.7:
-        data["risk_level"] = RiskLevel.HIGH
-    else:
-        data["risk_level"] = RiskLevel.CRITICAL
+    result.risk_level = _RISK_LEVELS[bisect_left(_RISK_THRESHOLDS, result.risk_score)]
 
     # Flip decision to NO_GO if policy adjustments pushed risk above threshold
     high_risk_threshold = 0.8
     hr_cfg = policy_config.rules.get("high_risk_threshold")
     if hr_cfg and hr_cfg.threshold is not None:
         high_risk_threshold = hr_cfg.threshold
-    if data["risk_score"] >= high_risk_threshold and data["decision"] == Decision.GO:
-        data["decision"] = Decision.NO_GO
-        if not data["recommended_actions"]:
-            data["recommended_actions"] = []
-        data["recommended_actions"].append(
+    if result.risk_score >= high_risk_threshold and result.decision == Decision.GO:
+        result.decision = Decision.NO_GO
+        result.recommended_actions.append(
             "[POLICY] Decision flipped to NO_GO: "
             "risk score exceeded threshold after policy adjustments"
         )
 
     # Ensure NO_GO decisions have at least HIGH risk_level
-    if data["decision"] == Decision.NO_GO and data["risk_level"] not in (
+    if result.decision == Decision.NO_GO and result.risk_level not in (
         RiskLevel.HIGH, RiskLevel.CRITICAL
     ):
-        data["risk_level"] = RiskLevel.HIGH
+        result.risk_level = RiskLevel.HIGH
 
-    # 6. Return the adjusted output:
-    return ReleaseOutput.model_validate(data)
+    # 6. Re-apply the model's own consistency rules (what model_validate
+    #    would have done) without re-validating every field:
+    return result.enforce_decision_consistency()
@@ -17,8 +17,9 @@ is instructed to respond ONLY with valid JSON matching the output schema.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 
-from release_agent.schemas import ReleaseInput, ReleaseOutput
+from release_agent.schemas import ReleaseInput, get_release_output_schema
 
 # ---------------------------------------------------------------------------
 # System Prompt
@@ -113,9 +114,13 @@ Analyze this release and provide your risk assessment as JSON."""
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
 def build_system_prompt() -> str:
     """Build the system prompt with the output schema injected.
 
+    The prompt depends only on ReleaseOutput, so it's built once and the
+    same string is returned on every later call.
+
     Returns:
         The complete system prompt string with JSON schema included.
     """
@@ -133,8 +138,7 @@ def build_system_prompt() -> str:
     #    return SYSTEM_PROMPT.format(schema=schema_str)
     #
     # Hint: The {schema} placeholder in SYSTEM_PROMPT is where it goes.
-    schema = ReleaseOutput.model_json_schema()
-    schema_str = json.dumps(schema, indent=2)
+    schema_str = json.dumps(get_release_output_schema(), indent=2)
     return SYSTEM_PROMPT.format(schema=schema_str)
 
 
@@ -179,15 +183,22 @@ def build_user_prompt(release: ReleaseInput) -> str:
     # 6. Return USER_PROMPT_TEMPLATE.format(...) with all the values
     #
     # Hint: Use "\n".join() to combine list items into sections.
-    # Files section
+    # Files section and totals, in a single pass over the changed files
+    total_additions = 0
+    total_deletions = 0
     if release.files_changed:
-        files_lines = []
+        # Patches are appended by reference, so each one is copied only
+        # once, by the final join:
+        files_parts: list[str] = []
         for f in release.files_changed:
-            line = f"- `{f.path}` (+{f.additions}/-{f.deletions})"
-            files_lines.append(line)
+            total_additions += f.additions
+            total_deletions += f.deletions
+            if files_parts:
+                files_parts.append("\n")
+            files_parts.append(f"- `{f.path}` (+{f.additions}/-{f.deletions})")
             if f.patch:
-                files_lines.append(f"  ```\n  {f.patch}\n  ```")
-        files_section = "\n".join(files_lines)
+                files_parts += ("\n  ```\n  ", f.patch, "\n  ```")
+        files_section = "".join(files_parts)
     else:
         files_section = "No file changes provided."
 
@@ -216,11 +227,6 @@ def build_user_prompt(release: ReleaseInput) -> str:
     else:
         incidents_section = "No recent incidents."
 
-    # Totals
-    num_files = len(release.files_changed)
-    total_additions = sum(f.additions for f in release.files_changed)
-    total_deletions = sum(f.deletions for f in release.files_changed)
-
     return USER_PROMPT_TEMPLATE.format(
         repo=release.repo,
         pr_number=release.pr_number,
@@ -228,7 +234,7 @@ def build_user_prompt(release: ReleaseInput) -> str:
         author=release.author,
         deployment_target=release.deployment_target,
         description=release.description or "No description provided.",
-        num_files=num_files,
+        num_files=len(release.files_changed),
         total_additions=total_additions,
         total_deletions=total_deletions,
         files_section=files_section,
@@ -16,8 +16,10 @@ Key design decisions:
 from __future__ import annotations
 
 from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -140,6 +142,29 @@ class ReleaseInput(BaseModel):
         "production", description="Target environment for deployment"
     )
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> ReleaseInput:
+        """Build a ReleaseInput from data that has already been validated.
+
+        Uses model_construct, so no field or model validators run. Only use
+        it for data this service produced itself, in Python form (e.g. a
+        stored ``model_dump()``, not parsed JSON: nothing is coerced).
+        Request bodies and other external input must go through the normal
+        constructor.
+
+        Args:
+            data: Field values, with nested items as dicts or models
+
+        Returns:
+            The constructed ReleaseInput
+        """
+        data = dict(data)
+        if "files_changed" in data:
+            data["files_changed"] = [_construct(FileChange, f) for f in data["files_changed"]]
+        if "ci_results" in data:
+            data["ci_results"] = [_construct(CIResult, c) for c in data["ci_results"]]
+        return cls.model_construct(**data)
+
 
 # ---------------------------------------------------------------------------
 # Output Schemas
@@ -184,12 +209,24 @@ class ReleaseOutput(BaseModel):
     # - If decision is GO with conditions, the conditions list should not be empty
     # Hint: Use @model_validator(mode='after') for cross-field validation.
     @model_validator(mode='after')
-    def cehc_decision_consistency(self) -> ReleaseOutput:
+    def check_decision_consistency(self) -> ReleaseOutput:
         """Ensure the decision is consistent with the risk assessment.
 
         Rather than raising on inconsistent LLM output, we auto-correct so
         the policy engine can apply its own adjustments downstream.
         """
+        return self.enforce_decision_consistency()
+
+    def enforce_decision_consistency(self) -> ReleaseOutput:
+        """Auto-correct decision, risk level and score in place.
+
+        The logic behind check_decision_consistency, as a plain method so
+        code that mutates an already-validated output (the policy engine)
+        can re-apply it without re-validating every field.
+
+        Returns:
+            This output, for chaining
+        """
         # Rule 1: NO_GO decisions should have at least HIGH risk level and
         # a risk_score in the HIGH range (>=0.5) for consistency
         if self.decision == Decision.NO_GO and self.risk_level not in (
@@ -231,3 +268,84 @@ class ReleaseOutput(BaseModel):
         default_factory=list,
         description="Recommended actions before/during deployment",
     )
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> ReleaseOutput:
+        """Build a ReleaseOutput from data that has already been validated.
+
+        Uses model_construct, so neither field validation nor
+        enforce_decision_consistency runs. Only use it for assessments this
+        service produced itself, in Python form (e.g. a cached
+        ``model_dump()``, not parsed JSON: enums are not coerced). LLM
+        replies and request bodies must go through the normal constructor.
+
+        Args:
+            data: Field values, with risk factors as dicts or models
+
+        Returns:
+            The constructed ReleaseOutput
+        """
+        data = dict(data)
+        if "risk_factors" in data:
+            data["risk_factors"] = [_construct(RiskFactor, r) for r in data["risk_factors"]]
+        return cls.model_construct(**data)
+
+
+class BatchItemError(BaseModel):
+    """Per-item failure in a batch assessment response.
+
+    Returned in place of a ReleaseOutput for releases that could not be
+    assessed, so one failure doesn't discard the rest of the batch.
+
+    Attributes:
+        error: Machine-readable error code
+        detail: Human-readable error message
+    """
+
+    error: str = Field(..., description="Error code, e.g. 'assessment_failed'")
+    detail: str = Field(..., description="What went wrong")
+
+
+def _construct[M: BaseModel](model: type[M], value: M | dict[str, Any]) -> M:
+    """model_construct a nested item unless it's already a model instance."""
+    return model.model_construct(**value) if isinstance(value, dict) else value
+
+
+# ---------------------------------------------------------------------------
+# Bulk Validation
+# ---------------------------------------------------------------------------
+
+# Validate whole lists in one pydantic-core call instead of one model_validate
+# per item (e.g. loading a gold example set). Built once, reused everywhere.
+RELEASE_INPUT_LIST_ADAPTER: TypeAdapter[list[ReleaseInput]] = TypeAdapter(list[ReleaseInput])
+RELEASE_OUTPUT_LIST_ADAPTER: TypeAdapter[list[ReleaseOutput]] = TypeAdapter(list[ReleaseOutput])
+
+
+# ---------------------------------------------------------------------------
+# Output Schema Cache
+# ---------------------------------------------------------------------------
+
+# The output schema never changes at runtime, so generate (and serialize) it
+# once at import instead of walking the Pydantic model on every call.
+_RELEASE_OUTPUT_JSON_SCHEMA: dict[str, Any] = ReleaseOutput.model_json_schema()
+_RELEASE_OUTPUT_JSON_SCHEMA_BYTES: bytes = orjson.dumps(_RELEASE_OUTPUT_JSON_SCHEMA)
+
+
+def get_release_output_schema() -> dict[str, Any]:
+    """Return the ReleaseOutput JSON schema.
+
+    The dict is shared by every caller; treat it as read-only.
+
+    Returns:
+        The JSON schema dict derived from ReleaseOutput
+    """
+    return _RELEASE_OUTPUT_JSON_SCHEMA
+
+
+def get_release_output_schema_bytes() -> bytes:
+    """Return the ReleaseOutput JSON schema pre-serialized as compact JSON.
+
+    Returns:
+        The orjson encoding of the ReleaseOutput schema
+    """
+    return _RELEASE_OUTPUT_JSON_SCHEMA_BYTES
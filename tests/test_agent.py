@@ -37,9 +37,9 @@ def fake_openai_key(monkeypatch):
     """Provide a fake API key so the OpenAI client can initialize."""
     monkeypatch.setenv("OPENAI_API_KEY", "test-fake-key")
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_input() -> ReleaseInput:
-    """A sample ReleaseInput for testing."""
+    """A sample ReleaseInput for testing (shared; don't mutate it)."""
     return ReleaseInput(
         repo="myorg/api",
         pr_number=42,
@@ -52,9 +52,9 @@ def sample_input() -> ReleaseInput:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_output() -> ReleaseOutput:
-    """A sample ReleaseOutput that the mock LLM will return."""
+    """A sample ReleaseOutput that the mock LLM will return (shared; don't mutate it)."""
     return ReleaseOutput(
         decision=Decision.GO,
         risk_level=RiskLevel.LOW,
@@ -1,5 +1,6 @@
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 from release_agent.main import app
@@ -7,6 +8,30 @@ from release_agent.schemas import Decision, ReleaseOutput, RiskLevel
 
 client = TestClient(app)
 
+
+@pytest.fixture
+def mock_output():
+    """A valid GO assessment returned by the mocked agent."""
+    return ReleaseOutput(
+        decision=Decision.GO,
+        risk_level=RiskLevel.LOW,
+        risk_score=0.1,
+        summary="Test summary for the mock response.",
+        explanation="Test explanation that is long enough to pass validation checks.",
+    )
+
+
+def _release_payload(pr_number, title="Test PR"):
+    """A minimal valid /assess request body."""
+    return {
+        "repo": "org/repo",
+        "pr_number": pr_number,
+        "title": title,
+        "author": "user",
+        "commit_messages": ["fix: test"],
+    }
+
+
 def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
@@ -16,6 +41,14 @@ def test_assess_invalid_input():
     response = client.post("/assess", json={"bad": "data"})
     assert response.status_code == 422
 
+def test_assess_invalid_json_body():
+    response = client.post(
+        "/assess", content=b"{not json", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 422
+    missing = client.post("/assess", json={"repo": "org/repo"}).json()["detail"]
+    assert ["body", "pr_number"] in [err["loc"] for err in missing]
+
 def test_assess_valid_input():
     # Mock the agent to avoid real LLM calls
     mock_output = ReleaseOutput(
@@ -42,3 +75,193 @@ def test_assess_valid_input():
         })
         assert response.status_code == 200
         assert response.json()["decision"] == "GO"
+
+def test_rate_limiter_sliding_window():
+    import asyncio
+
+    from release_agent.main import RateLimiter
+
+    limiter = RateLimiter(max_requests=2, window_seconds=3600)
+    results = [asyncio.run(limiter.is_allowed("1.2.3.4")) for _ in range(3)]
+    assert results == [True, True, False]
+    assert asyncio.run(limiter.is_allowed("5.6.7.8"))
+
+def test_rate_limiter_evicts_idle_clients():
+    from release_agent.main import RateLimiter
+
+    limiter = RateLimiter(max_requests=2, window_seconds=60)
+    limiter._hit_local("1.2.3.4", bucket=100)
+    limiter._hit_local("5.6.7.8", bucket=101)
+    limiter._hit_local("5.6.7.8", bucket=102)
+    assert set(limiter._counts) == {"5.6.7.8"}
+
+def test_rate_limit_returns_429():
+    from release_agent.main import RateLimiter
+
+    with patch.object(
+        app.state, "rate_limiter", RateLimiter(max_requests=0), create=True
+    ):
+        response = client.post("/assess", json={"bad": "data"})
+        assert response.status_code == 429
+        assert "retry-after" in response.headers
+        assert client.get("/health").status_code == 200
+
+        # Rejections still go through CORS and request-ID middleware
+        cors = client.post("/assess", json={}, headers={"Origin": "https://app.example"})
+        assert cors.status_code == 429
+        assert cors.headers["access-control-allow-origin"] == "https://app.example"
+        assert "x-request-id" in cors.headers
+
+def test_rate_limit_keys_on_trusted_forwarded_address():
+    from release_agent.main import RateLimitMiddleware
+
+    scope = {
+        "client": ("10.0.0.1", 1234),
+        "headers": [(b"x-forwarded-for", b"6.6.6.6, 203.0.113.7")],
+    }
+    assert RateLimitMiddleware(app, trusted_proxy_hops=0).client_address(scope) == "10.0.0.1"
+    assert RateLimitMiddleware(app, trusted_proxy_hops=1).client_address(scope) == "203.0.113.7"
+    # Fewer hops than configured proxies: fall back to the peer address
+    assert RateLimitMiddleware(app, trusted_proxy_hops=3).client_address(scope) == "10.0.0.1"
+
+def test_assess_etag_short_circuits_resubmission(mock_output):
+    payload = _release_payload(1)
+
+    with patch.object(app.state, "agent", create=True) as mock_agent:
+        mock_agent.assess = AsyncMock(return_value=mock_output)
+        first = client.post("/assess", json=payload)
+        etag = first.headers["etag"]
+
+        second = client.post("/assess", json=payload, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert mock_agent.assess.await_count == 1
+
+def test_assess_etag_ignores_wildcard_and_tracks_namespace(mock_output):
+    payload = _release_payload(9)
+
+    with patch.object(app.state, "agent", create=True) as mock_agent:
+        mock_agent.assess = AsyncMock(return_value=mock_output)
+        wildcard = client.post("/assess", json=payload, headers={"If-None-Match": "*"})
+        assert wildcard.status_code == 200
+        assert mock_agent.assess.await_count == 1
+
+        with patch.object(app.state, "assessment_namespace", "new-model|rules", create=True):
+            changed = client.post(
+                "/assess", json=payload, headers={"If-None-Match": wildcard.headers["etag"]}
+            )
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != wildcard.headers["etag"]
+
+def test_assess_serves_repeat_inputs_from_cache(mock_output):
+    from release_agent.main import AssessmentCache
+
+    payload = _release_payload(2, "Cached PR")
+
+    with (
+        patch.object(app.state, "agent", create=True) as mock_agent,
+        patch.object(app.state, "cache", AssessmentCache(), create=True),
+    ):
+        mock_agent.assess = AsyncMock(return_value=mock_output)
+        for _ in range(2):
+            response = client.post("/assess", json=payload)
+            assert response.status_code == 200
+        assert mock_agent.assess.await_count == 1
+
+def test_assess_batch_isolates_failures(mock_output):
+    payload = _release_payload(3, "Batch PR")
+
+    with patch.object(app.state, "agent", create=True) as mock_agent:
+        mock_agent.assess = AsyncMock(side_effect=[mock_output, RuntimeError("LLM down")])
+        response = client.post("/assess/batch", json=[payload, {**payload, "pr_number": 4}])
+        assert response.status_code == 200
+        first, second = response.json()
+        assert first["decision"] == "GO"
+        assert second == {"error": "assessment_failed", "detail": "LLM down"}
+
+def test_concurrent_identical_assessments_share_one_call(mock_output):
+    import asyncio
+
+    from release_agent.main import AssessmentCache, _assess_cached
+    from release_agent.schemas import ReleaseInput
+
+    release = ReleaseInput.model_validate(_release_payload(5))
+
+    async def slow_assess(_release):
+        await asyncio.sleep(0.01)
+        return mock_output
+
+    agent = AsyncMock()
+    agent.assess = AsyncMock(side_effect=slow_assess)
+
+    async def run():
+        cache = AssessmentCache()
+        return await asyncio.gather(*(_assess_cached(agent, release, cache) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert all(r is mock_output for r in results)
+    assert agent.assess.await_count == 1
+
+def test_shared_assessment_cancelled_only_when_no_waiters_remain(mock_output):
+    import asyncio
+
+    from release_agent.main import AssessmentCache
+
+    async def run():
+        cache = AssessmentCache()
+        started = asyncio.Event()
+
+        async def slow_assess():
+            started.set()
+            await asyncio.sleep(10)
+            return mock_output
+
+        first = asyncio.ensure_future(cache.get_or_assess("k", slow_assess))
+        second = asyncio.ensure_future(cache.get_or_assess("k", slow_assess))
+        await started.wait()
+        shared = cache._inflight["k"].task
+
+        first.cancel()
+        await asyncio.sleep(0)
+        assert not shared.cancelled() and not shared.done()
+
+        second.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert shared.cancelled()
+        assert "k" not in cache._inflight
+
+    asyncio.run(run())
+
+def test_assess_batch_streams_ndjson(mock_output):
+    import json
+
+    payload = _release_payload(6, "Stream PR")
+
+    with patch.object(app.state, "agent", create=True) as mock_agent:
+        mock_agent.assess = AsyncMock(side_effect=[mock_output, ValueError("bad output")])
+        response = client.post(
+            "/assess/batch",
+            json=[payload, {**payload, "pr_number": 7}],
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = sorted(
+            (json.loads(line) for line in response.text.splitlines()),
+            key=lambda item: item["index"],
+        )
+        assert lines[0]["result"]["decision"] == "GO"
+        assert lines[1] == {"index": 1, "error": "validation_error", "detail": "bad output"}
+
+def test_assess_batch_gzips_large_responses(mock_output):
+    payload = _release_payload(8, "Gzip PR")
+
+    with patch.object(app.state, "agent", create=True) as mock_agent:
+        mock_agent.assess = AsyncMock(return_value=mock_output)
+        batch = [{**payload, "pr_number": n} for n in range(1, 21)]
+        response = client.post(
+            "/assess/batch", json=batch, headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 20
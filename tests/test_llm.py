@@ -0,0 +1,130 @@
+"""Tests for the LLM client wrapper.
+
+These tests exercise client-side behavior (request batching, response
+handling) with the underlying OpenAI client mocked out, so no real API
+calls are made.
+
+Run with: pytest tests/test_llm.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from release_agent.llm import LLMClient
+from release_agent.schemas import Decision, ReleaseOutput
+
+
+@pytest.fixture(autouse=True)
+def fake_openai_key(monkeypatch):
+    """Provide a fake API key so the OpenAI client can initialize."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-fake-key")
+
+
+def _embeddings_response(texts: list[str]) -> SimpleNamespace:
+    """Build a fake embeddings response with one vector per input text."""
+    return SimpleNamespace(
+        data=[
+            SimpleNamespace(index=i, embedding=[float(len(t)), float(i)])
+            for i, t in enumerate(texts)
+        ]
+    )
+
+
+class TestEmbeddingBatching:
+    """Tests for get_embedding() request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self) -> None:
+        """Concurrent get_embedding() calls should be sent as one batch."""
+        client = LLMClient()
+        create = AsyncMock(side_effect=lambda model, input: _embeddings_response(input))
+        client._client.embeddings.create = create
+
+        texts = ["a", "bb", "ccc"]
+        vectors = await asyncio.gather(*(client.get_embedding(t) for t in texts))
+
+        create.assert_awaited_once()
+        assert create.await_args.kwargs["input"] == texts
+        assert [v[0] for v in vectors] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_api_error_propagates_to_callers(self) -> None:
+        """A failed batch request should raise in every waiting caller."""
+        client = LLMClient()
+        client._client.embeddings.create = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await client.get_embedding("text")
+
+
+class TestAssessRiskRetry:
+    """Tests for assess_risk() retry behavior."""
+
+    @pytest.mark.asyncio
+    async def test_refusal_is_not_retried(self) -> None:
+        """A ValueError (refusal / bad schema) should fail on the first attempt."""
+        client = LLMClient()
+        message = SimpleNamespace(refusal="no", content=None)
+        create = AsyncMock(
+            return_value=SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        )
+        client._client.chat.completions.create = create
+
+        with pytest.raises(ValueError, match="refused"):
+            await client.assess_risk("system", "user")
+
+        create.assert_awaited_once()
+
+
+class TestAssessRiskResponse:
+    """Tests for assess_risk() request and response handling."""
+
+    @pytest.mark.asyncio
+    async def test_reply_validated_with_shared_response_format(self) -> None:
+        """Every call sends the same prebuilt schema and parses the JSON reply."""
+        client = LLMClient()
+        content = (
+            '{"decision": "GO", "risk_level": "LOW", "risk_score": 0.1,'
+            ' "summary": "Small, well-tested change.",'
+            ' "explanation": "Only documentation files were modified in this PR."}'
+        )
+        message = SimpleNamespace(refusal=None, content=content)
+        create = AsyncMock(
+            return_value=SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        )
+        client._client.chat.completions.create = create
+
+        first = await client.assess_risk("system", "user")
+        await client.assess_risk("system", "user")
+
+        assert isinstance(first, ReleaseOutput)
+        assert first.decision == Decision.GO
+        formats = [call.kwargs["response_format"] for call in create.await_args_list]
+        assert formats[0] is formats[1]
+        assert formats[0]["json_schema"]["strict"] is True
+
+    def test_response_format_schema_is_strict(self) -> None:
+        """Every object forbids extra keys and requires all properties; no $ref siblings."""
+        from release_agent.llm import _RESPONSE_FORMAT
+
+        def walk(node):
+            if isinstance(node, dict):
+                if "$ref" in node:
+                    assert len(node) == 1, node
+                if node.get("type") == "object" and "properties" in node:
+                    assert node["additionalProperties"] is False
+                    assert node["required"] == list(node["properties"])
+                for value in node.values():
+                    walk(value)
+            elif isinstance(node, list):
+                for item in node:
+                    walk(item)
+
+        schema = _RESPONSE_FORMAT["json_schema"]["schema"]
+        walk(schema)
+        assert schema["properties"]["risk_level"]["enum"] == ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
@@ -24,6 +24,7 @@ from release_agent.policy import (
     RuleConfig,
     apply_policies,
     load_policy_config,
+    requires,
     rule_auth_changes,
     rule_ci_failures,
     rule_database_migration,
@@ -81,6 +82,43 @@ def base_output() -> ReleaseOutput:
     )
 
 
+def _session_policy_file(tmp_path_factory: pytest.TempPathFactory, text: str) -> Path:
+    """Write a read-only policy file shared by every test in the session."""
+    path = tmp_path_factory.mktemp("policy") / "policy.yaml"
+    path.write_text(text)
+    return path
+
+
+@pytest.fixture(scope="session")
+def disabled_ci_policy(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Policy file that turns off rule_ci_failures."""
+    return _session_policy_file(
+        tmp_path_factory,
+        "rules:\n"
+        "  rule_ci_failures:\n"
+        "    enabled: false\n",
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_policy(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Policy file with no rule overrides."""
+    return _session_policy_file(tmp_path_factory, "rules: {}\n")
+
+
+@pytest.fixture(scope="session")
+def tuned_policy(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Policy file lowering the risk threshold and the migration adjustment."""
+    return _session_policy_file(
+        tmp_path_factory,
+        "rules:\n"
+        "  rule_high_risk_threshold:\n"
+        "    threshold: 0.5\n"
+        "  rule_database_migration:\n"
+        "    risk_adjustment: 0.05\n",
+    )
+
+
 # ---------------------------------------------------------------------------
 # CI Failure Rule Tests
 # ---------------------------------------------------------------------------
@@ -450,6 +488,25 @@ class TestApplyPolicies:
         result = apply_policies(base_output, base_input)
         assert result.risk_score <= 1.0
 
+    def test_rule_skipped_when_required_input_empty(
+        self, base_output: ReleaseOutput, base_input: ReleaseInput
+    ) -> None:
+        """Rules marked with @requires aren't called when that input is empty."""
+        calls: list[str] = []
+
+        @requires("recent_incidents")
+        def rule_spy(output, input_data, config=None):
+            calls.append(input_data.repo)
+            return None
+
+        base_input.recent_incidents = []
+        apply_policies(base_output, base_input, rules=[rule_spy])
+        assert calls == []
+
+        base_input.recent_incidents = ["INC-1"]
+        apply_policies(base_output, base_input, rules=[rule_spy])
+        assert calls == [base_input.repo]
+
 
 # ---------------------------------------------------------------------------
 # Policy Config Tests
@@ -464,6 +521,7 @@ class TestPolicyConfig:
         cfg = load_policy_config(tmp_path / "nonexistent.yaml")
         assert cfg == PolicyConfig()
         assert cfg.rules == {}
+        assert load_policy_config(tmp_path / "other.yaml") is cfg
 
     def test_load_config_valid_yaml(self, tmp_path: Path) -> None:
         """Valid YAML is loaded and validated."""
@@ -477,6 +535,16 @@ class TestPolicyConfig:
         assert "rule_high_risk_threshold" in cfg.rules
         assert cfg.rules["rule_high_risk_threshold"].threshold == 0.5
 
+    def test_load_config_cached_until_file_changes(self, tmp_path: Path) -> None:
+        """Unchanged files come from the cache; edited files are reloaded."""
+        config_file = tmp_path / "policy.yaml"
+        config_file.write_text("rules:\n  rule_large_pr:\n    threshold: 100\n")
+        first = load_policy_config(config_file)
+        assert load_policy_config(config_file) is first
+
+        config_file.write_text("rules:\n  rule_large_pr:\n    threshold: 2500\n")
+        assert load_policy_config(config_file).rules["rule_large_pr"].threshold == 2500
+
     def test_load_config_invalid_yaml(self, tmp_path: Path) -> None:
         """Invalid YAML raises ValueError."""
         config_file = tmp_path / "bad.yaml"
@@ -539,7 +607,7 @@ class TestPolicyConfig:
         assert result.risk_adjustment == 0.3
 
     def test_disabled_rule_is_skipped(
-        self, base_output: ReleaseOutput, base_input: ReleaseInput, tmp_path: Path
+        self, base_output: ReleaseOutput, base_input: ReleaseInput, disabled_ci_policy: Path
     ) -> None:
         """Rules with enabled: false are skipped by apply_policies."""
         base_input.ci_results = [
@@ -550,43 +618,27 @@ class TestPolicyConfig:
         assert result.decision == Decision.NO_GO
 
         # With ci_failures disabled, decision stays GO
-        config_file = tmp_path / "policy.yaml"
-        config_file.write_text(
-            "rules:\n"
-            "  rule_ci_failures:\n"
-            "    enabled: false\n"
-        )
-        result = apply_policies(base_output, base_input, config_path=config_file)
+        result = apply_policies(base_output, base_input, config_path=disabled_ci_policy)
         assert result.decision == Decision.GO
 
     def test_config_falls_back_to_defaults(
-        self, base_output: ReleaseOutput, base_input: ReleaseInput, tmp_path: Path
+        self, base_output: ReleaseOutput, base_input: ReleaseInput, empty_policy: Path
     ) -> None:
         """Rules not mentioned in config use default behavior."""
         base_output.risk_score = 0.8
         # Empty config file — all defaults apply
-        config_file = tmp_path / "policy.yaml"
-        config_file.write_text("rules: {}\n")
-        result = apply_policies(base_output, base_input, config_path=config_file)
+        result = apply_policies(base_output, base_input, config_path=empty_policy)
         assert result.decision == Decision.NO_GO
 
     def test_apply_policies_with_config_path(
-        self, base_output: ReleaseOutput, base_input: ReleaseInput, tmp_path: Path
+        self, base_output: ReleaseOutput, base_input: ReleaseInput, tuned_policy: Path
     ) -> None:
         """apply_policies integrates config_path end-to-end."""
         base_output.risk_score = 0.6
         base_input.files_changed = [
             FileChange(path="migrations/001.sql", additions=10, deletions=0),
         ]
-        config_file = tmp_path / "policy.yaml"
-        config_file.write_text(
-            "rules:\n"
-            "  rule_high_risk_threshold:\n"
-            "    threshold: 0.5\n"
-            "  rule_database_migration:\n"
-            "    risk_adjustment: 0.05\n"
-        )
-        result = apply_policies(base_output, base_input, config_path=config_file)
+        result = apply_policies(base_output, base_input, config_path=tuned_policy)
         # high_risk_threshold with threshold=0.5 triggers on 0.6 → NO_GO
         assert result.decision == Decision.NO_GO
         # migration risk adjustment is 0.05 instead of default 0.15
@@ -17,6 +17,8 @@ import pytest
 from pydantic import ValidationError
 
 from release_agent.schemas import (
+    RELEASE_INPUT_LIST_ADAPTER,
+    RELEASE_OUTPUT_LIST_ADAPTER,
     CIResult,
     Decision,
     FileChange,
@@ -91,6 +93,25 @@ def sample_release_output() -> dict:
     }
 
 
+@pytest.fixture(scope="session")
+def gold_examples() -> list[dict]:
+    """Raw gold examples, read from disk once per session."""
+    with open("tests/fixtures/gold_examples.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def parsed_gold_examples(
+    gold_examples: list[dict],
+) -> list[tuple[dict, ReleaseInput, ReleaseOutput]]:
+    """Each gold example with its validated input and expected output."""
+    inputs = RELEASE_INPUT_LIST_ADAPTER.validate_python([ex["input"] for ex in gold_examples])
+    outputs = RELEASE_OUTPUT_LIST_ADAPTER.validate_python(
+        [ex["expected_output"] for ex in gold_examples]
+    )
+    return list(zip(gold_examples, inputs, outputs, strict=True))
+
+
 # ---------------------------------------------------------------------------
 # FileChange Tests
 # ---------------------------------------------------------------------------
@@ -204,6 +225,15 @@ class TestReleaseInput:
         ri2 = ReleaseInput.model_validate_json(json_str)
         assert ri == ri2
 
+    def test_release_input_from_trusted_roundtrip(
+        self, sample_release_input: dict
+    ) -> None:
+        """from_trusted rebuilds an equal ReleaseInput from its model_dump."""
+        ri = ReleaseInput(**sample_release_input)
+        ri2 = ReleaseInput.from_trusted(ri.model_dump())
+        assert ri2 == ri
+        assert isinstance(ri2.files_changed[0], FileChange)
+
     def test_release_input_json_schema_generation(self) -> None:
         """ReleaseInput can generate a JSON schema."""
         schema = ReleaseInput.model_json_schema()
@@ -274,6 +304,17 @@ class TestReleaseOutput:
         ro2 = ReleaseOutput.model_validate_json(json_str)
         assert ro == ro2
 
+    def test_release_output_from_trusted_skips_validation(
+        self, sample_release_output: dict
+    ) -> None:
+        """from_trusted rebuilds the model without re-running validators."""
+        ro = ReleaseOutput(**sample_release_output)
+        assert ReleaseOutput.from_trusted(ro.model_dump()) == ro
+
+        # Inconsistent on purpose: the normal constructor would flip this to NO_GO
+        trusted = ReleaseOutput.from_trusted({**ro.model_dump(), "risk_score": 0.9})
+        assert trusted.decision == ro.decision
+
     def test_release_output_json_schema_generation(self) -> None:
         """ReleaseOutput can generate a JSON schema for LLM structured output."""
         schema = ReleaseOutput.model_json_schema()
@@ -309,34 +350,27 @@ class TestRiskFactor:
 class TestGoldExamples:
     """Tests that gold examples are valid and parseable."""
 
-    def test_gold_examples_parse(self) -> None:
+    def test_gold_examples_parse(
+        self,
+        gold_examples: list[dict],
+        parsed_gold_examples: list[tuple[dict, ReleaseInput, ReleaseOutput]],
+    ) -> None:
         """All gold examples should parse as valid ReleaseInput/ReleaseOutput."""
-        with open("tests/fixtures/gold_examples.json") as f:
-            examples = json.load(f)
-
-        assert len(examples) >= 5, "Expected at least 5 gold examples"
+        assert len(gold_examples) >= 5, "Expected at least 5 gold examples"
 
-        for example in examples:
+        for example in gold_examples:
             assert "id" in example, "Each example must have an id"
             assert "input" in example, f"Example {example['id']} missing input"
             assert "expected_output" in example, f"Example {example['id']} missing expected_output"
 
-            # Validate input parses
-            input_data = ReleaseInput.model_validate(example["input"])
+        for example, input_data, output_data in parsed_gold_examples:
             assert input_data.repo, f"Example {example['id']} has empty repo"
-
-            # Validate output parses
-            output_data = ReleaseOutput.model_validate(example["expected_output"])
             assert output_data.decision in (Decision.GO, Decision.NO_GO)
 
-    def test_gold_examples_have_both_decisions(self) -> None:
+    def test_gold_examples_have_both_decisions(
+        self, parsed_gold_examples: list[tuple[dict, ReleaseInput, ReleaseOutput]]
+    ) -> None:
         """Gold examples should include both GO and NO_GO cases."""
-        with open("tests/fixtures/gold_examples.json") as f:
-            examples = json.load(f)
-
-        decisions = {
-            ReleaseOutput.model_validate(ex["expected_output"]).decision
-            for ex in examples
-        }
+        decisions = {output.decision for _, _, output in parsed_gold_examples}
         assert Decision.GO in decisions, "Need at least one GO example"
         assert Decision.NO_GO in decisions, "Need at least one NO_GO example"